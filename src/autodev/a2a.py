@@ -125,15 +125,13 @@ class A2AServer:
 
 			now = _now_iso()
 			plan = Plan(objective=req.title, status="active")
-			db.insert_plan(plan)
-
 			unit = WorkUnit(
 				plan_id=plan.id,
 				title=req.title,
 				description=req.description,
 				status="pending",
 			)
-			db.insert_work_unit(unit)
+			db.persist_plan(plan, [unit])
 
 			status = A2ATaskStatus(
 				id=unit.id,
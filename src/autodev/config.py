@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import os
 import re
@@ -1411,6 +1413,13 @@ def _build_deliberation(data: dict[str, Any]) -> DeliberationConfig:
 	return dc
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_toml_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+	"""Parse a TOML file; keyed on mtime/size so a rewrite invalidates the entry."""
+	with open(path, "rb") as f:
+		return tomllib.load(f)
+
+
 def load_config(path: str | Path) -> MissionConfig:
 	"""Load a autodev.toml config file.
 
@@ -1428,8 +1437,8 @@ def load_config(path: str | Path) -> MissionConfig:
 	if not config_path.exists():
 		raise FileNotFoundError(f"Config file not found: {config_path}")
 
-	with open(config_path, "rb") as f:
-		data = tomllib.load(f)
+	st = config_path.stat()
+	data = copy.deepcopy(_parse_toml_cached(str(config_path.resolve()), st.st_mtime_ns, st.st_size))
 
 	mc = MissionConfig()
 	if "target" in data:
@@ -1552,6 +1552,23 @@ class ContinuousController:
 		"exploratory: refactor surrounding code as needed for the best long-term design",
 	)
 
+	def _speculation_exceeds_budget(self, mission: Mission) -> bool:
+		"""Whether the projected cost of all branches exceeds the remaining run budget."""
+		spec_cfg = self.config.speculation
+		budget_limit = self.config.scheduler.budget.max_per_run_usd
+		ema_val = self._ema.value
+		if budget_limit <= 0 or ema_val is None or ema_val <= 0:
+			return False
+		projected_cost = spec_cfg.branch_count * ema_val * spec_cfg.cost_limit_multiplier
+		remaining = budget_limit - mission.total_cost_usd
+		if projected_cost > remaining:
+			logger.info(
+				"Speculation cost cap: projected $%.2f > remaining $%.2f, falling back to single dispatch",
+				projected_cost, remaining,
+			)
+			return True
+		return False
+
 	async def _dispatch_speculated_unit(
 		self,
 		unit: WorkUnit,
@@ -1564,21 +1581,9 @@ class ContinuousController:
 		Returns True if speculation was dispatched, False if fallback to
 		single dispatch is needed (e.g. cost cap exceeded).
 		"""
-		spec_cfg = self.config.speculation
-		branch_count = spec_cfg.branch_count
-
-		# Cost guard: check projected cost against remaining budget
-		budget_limit = self.config.scheduler.budget.max_per_run_usd
-		ema_val = self._ema.value
-		if budget_limit > 0 and ema_val is not None and ema_val > 0:
-			projected_cost = branch_count * ema_val * spec_cfg.cost_limit_multiplier
-			remaining = budget_limit - mission.total_cost_usd
-			if projected_cost > remaining:
-				logger.info(
-					"Speculation cost cap: projected $%.2f > remaining $%.2f, falling back to single dispatch",
-					projected_cost, remaining,
-				)
-				return False
+		branch_count = self.config.speculation.branch_count
+		if self._speculation_exceeds_budget(mission):
+			return False
 
 		# Mark parent unit
 		unit.unit_type = "speculation_parent"
@@ -8,7 +8,7 @@ import logging
 import re
 import sqlite3
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Generator, Sequence
 
@@ -298,6 +298,7 @@ CREATE TABLE IF NOT EXISTS signals (
 );
 
 CREATE INDEX IF NOT EXISTS idx_signals_mission ON signals(mission_id, status);
+CREATE INDEX IF NOT EXISTS idx_signals_status_created ON signals(status, created_at);
 
 CREATE TABLE IF NOT EXISTS epochs (
 	id TEXT PRIMARY KEY,
@@ -561,6 +562,7 @@ CREATE TABLE IF NOT EXISTS speculation_results (
 	timestamp TEXT NOT NULL
 );
 CREATE INDEX IF NOT EXISTS idx_speculation_results_parent ON speculation_results(parent_unit_id);
+CREATE INDEX IF NOT EXISTS idx_speculation_results_mission ON speculation_results(mission_id, timestamp);
 
 CREATE TABLE IF NOT EXISTS applied_proposals (
 	id TEXT PRIMARY KEY,
@@ -643,7 +645,8 @@ def derive_unit_status(events: Sequence[UnitEvent]) -> str:
 class Database:
 	"""SQLite database for autodev state."""
 
-	def __init__(self, path: str | Path = ":memory:") -> None:
+	def __init__(self, path: str | Path = ":memory:", template: Database | None = None) -> None:
+		"""Open the database at *path*, copying schema from *template* via the backup API if given."""
 		db_path = str(path)
 		self.conn = sqlite3.connect(db_path)
 		self.conn.row_factory = sqlite3.Row
@@ -654,7 +657,10 @@ class Database:
 			logger.debug("WAL mode activated for %s", db_path)
 		self.conn.execute("PRAGMA foreign_keys=ON")
 		self._lock = asyncio.Lock()
-		self._create_tables()
+		if template is not None:
+			template.conn.backup(self.conn)
+		else:
+			self._create_tables()
 
 	@staticmethod
 	def _validate_identifier(name: str) -> None:
@@ -1166,6 +1172,16 @@ class Database:
 	# -- Plans --
 
 	def insert_plan(self, plan: Plan) -> None:
+		with self.transaction():
+			self._insert_plan_row(plan)
+
+	def persist_plan(self, plan: Plan, units: Sequence[WorkUnit]) -> None:
+		"""Insert a plan and its work units in a single transaction."""
+		with self.transaction():
+			self._insert_plan_row(plan)
+			self._insert_work_unit_rows(units)
+
+	def _insert_plan_row(self, plan: Plan) -> None:
 		self.conn.execute(
 			"""INSERT INTO plans
 			(id, objective, status, created_at, finished_at,
@@ -1179,7 +1195,6 @@ class Database:
 				plan.round_id,
 			),
 		)
-		self.conn.commit()
 
 	def update_plan(self, plan: Plan) -> None:
 		self.conn.execute(
@@ -1222,7 +1237,15 @@ class Database:
 	# -- Work Units --
 
 	def insert_work_unit(self, unit: WorkUnit) -> None:
-		self.conn.execute(
+		self.insert_work_units([unit])
+
+	def insert_work_units(self, units: Sequence[WorkUnit]) -> None:
+		"""Insert units in one executemany; all-or-nothing."""
+		with self.transaction():
+			self._insert_work_unit_rows(units)
+
+	def _insert_work_unit_rows(self, units: Sequence[WorkUnit]) -> None:
+		self.conn.executemany(
 			"""INSERT INTO work_units
 			(id, plan_id, title, description, files_hint, verification_hint,
 			 priority, status, worker_id, round_id, handoff_id,
@@ -1236,24 +1259,27 @@ class Database:
 			 parent_unit_id)
 			VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
 			 ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-			(
-				unit.id, unit.plan_id, unit.title, unit.description,
-				unit.files_hint, unit.verification_hint, unit.priority,
-				unit.status, unit.worker_id, unit.round_id,
-				unit.handoff_id, unit.depends_on, unit.branch_name,
-				unit.claimed_at, unit.heartbeat_at, unit.started_at,
-				unit.finished_at, unit.exit_code, unit.commit_hash,
-				unit.output_summary, unit.attempt, unit.max_attempts,
-				unit.unit_type, unit.timeout, unit.verification_command,
-				unit.epoch_id, unit.input_tokens, unit.output_tokens, unit.cost_usd,
-				int(unit.experiment_mode), unit.acceptance_criteria, unit.specialist,
-				unit.speculation_score, unit.speculation_parent_id, unit.session_id,
-				json.dumps(unit.write_scope) if unit.write_scope else "",
-				unit.parent_unit_id,
-			),
+			[
+				(
+					unit.id, unit.plan_id, unit.title, unit.description,
+					unit.files_hint, unit.verification_hint, unit.priority,
+					unit.status, unit.worker_id, unit.round_id,
+					unit.handoff_id, unit.depends_on, unit.branch_name,
+					unit.claimed_at, unit.heartbeat_at, unit.started_at,
+					unit.finished_at, unit.exit_code, unit.commit_hash,
+					unit.output_summary, unit.attempt, unit.max_attempts,
+					unit.unit_type, unit.timeout, unit.verification_command,
+					unit.epoch_id, unit.input_tokens, unit.output_tokens, unit.cost_usd,
+					int(unit.experiment_mode), unit.acceptance_criteria, unit.specialist,
+					unit.speculation_score, unit.speculation_parent_id, unit.session_id,
+					json.dumps(unit.write_scope) if unit.write_scope else "",
+					unit.parent_unit_id,
+				)
+				for unit in units
+			],
 		)
-		self.conn.commit()
-		logger.info("Inserted work_unit %s (status=%s, type=%s)", unit.id, unit.status, unit.unit_type)
+		for unit in units:
+			logger.info("Inserted work_unit %s (status=%s, type=%s)", unit.id, unit.status, unit.unit_type)
 
 	def update_work_unit(self, unit: WorkUnit) -> None:
 		self.conn.execute(
@@ -1727,21 +1753,29 @@ class Database:
 	# -- Missions --
 
 	def insert_mission(self, mission: Mission) -> None:
-		self.conn.execute(
-			"""INSERT INTO missions
-			(id, objective, status, started_at, finished_at,
-			 total_rounds, total_cost_usd, final_score, stopped_reason, chain_id)
-			VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-			(
-				mission.id, mission.objective, mission.status,
-				mission.started_at, mission.finished_at,
-				mission.total_rounds, mission.total_cost_usd,
-				mission.final_score, mission.stopped_reason,
-				mission.chain_id,
-			),
-		)
-		self.conn.commit()
-		logger.info("Inserted mission %s (status=%s)", mission.id, mission.status)
+		self.insert_missions([mission])
+
+	def insert_missions(self, missions: Sequence[Mission]) -> None:
+		"""Insert missions in one executemany; all-or-nothing."""
+		with self.transaction() as conn:
+			conn.executemany(
+				"""INSERT INTO missions
+				(id, objective, status, started_at, finished_at,
+				 total_rounds, total_cost_usd, final_score, stopped_reason, chain_id)
+				VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+				[
+					(
+						mission.id, mission.objective, mission.status,
+						mission.started_at, mission.finished_at,
+						mission.total_rounds, mission.total_cost_usd,
+						mission.final_score, mission.stopped_reason,
+						mission.chain_id,
+					)
+					for mission in missions
+				],
+			)
+		for mission in missions:
+			logger.info("Inserted mission %s (status=%s)", mission.id, mission.status)
 
 	def update_mission(self, mission: Mission) -> None:
 		self.conn.execute(
@@ -2208,13 +2242,11 @@ class Database:
 
 	def expire_stale_signals(self, timeout_minutes: int = 10) -> int:
 		"""Expire unacknowledged signals older than timeout. Returns count expired."""
-		from autodev.models import _now_iso
-		now = _now_iso()
+		# created_at is always written by _now_iso() (UTC isoformat), so ISO strings sort chronologically
+		cutoff = (datetime.now(timezone.utc) - timedelta(minutes=timeout_minutes)).isoformat()
 		cursor = self.conn.execute(
-			"""UPDATE signals SET status='expired'
-			WHERE status='pending'
-			AND (julianday(?) - julianday(created_at)) * 1440 > ?""",
-			(now, timeout_minutes),
+			"UPDATE signals SET status='expired' WHERE status='pending' AND created_at < ?",
+			(cutoff,),
 		)
 		self.conn.commit()
 		return cursor.rowcount
@@ -2540,17 +2572,24 @@ class Database:
 	# -- Strategic Context --
 
 	def insert_strategic_context(self, ctx: StrategicContext) -> None:
-		self.conn.execute(
-			"""INSERT INTO strategic_context
-			(id, mission_id, timestamp, what_attempted, what_worked, what_failed, recommended_next)
-			VALUES (?, ?, ?, ?, ?, ?, ?)""",
-			(
-				ctx.id, ctx.mission_id, ctx.timestamp,
-				ctx.what_attempted, ctx.what_worked,
-				ctx.what_failed, ctx.recommended_next,
-			),
-		)
-		self.conn.commit()
+		self.insert_strategic_contexts([ctx])
+
+	def insert_strategic_contexts(self, contexts: Sequence[StrategicContext]) -> None:
+		"""Insert contexts in one executemany; all-or-nothing."""
+		with self.transaction() as conn:
+			conn.executemany(
+				"""INSERT INTO strategic_context
+				(id, mission_id, timestamp, what_attempted, what_worked, what_failed, recommended_next)
+				VALUES (?, ?, ?, ?, ?, ?, ?)""",
+				[
+					(
+						ctx.id, ctx.mission_id, ctx.timestamp,
+						ctx.what_attempted, ctx.what_worked,
+						ctx.what_failed, ctx.recommended_next,
+					)
+					for ctx in contexts
+				],
+			)
 
 	def get_strategic_context(self, limit: int = 10) -> list[StrategicContext]:
 		rows = self.conn.execute(
@@ -2638,21 +2677,28 @@ class Database:
 	# -- Speculation Results --
 
 	def insert_speculation_result(self, result: SpeculationResult) -> None:
-		self.conn.execute(
-			"""INSERT INTO speculation_results
-			(id, parent_unit_id, winner_branch_id, mission_id, epoch_id,
-			 branch_count, branch_ids, branch_scores,
-			 total_speculation_cost_usd, selection_metric, timestamp)
-			VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-			(
-				result.id, result.parent_unit_id, result.winner_branch_id,
-				result.mission_id, result.epoch_id,
-				result.branch_count, result.branch_ids, result.branch_scores,
-				result.total_speculation_cost_usd, result.selection_metric,
-				result.timestamp,
-			),
-		)
-		self.conn.commit()
+		self.insert_speculation_results([result])
+
+	def insert_speculation_results(self, results: Sequence[SpeculationResult]) -> None:
+		"""Insert results in one executemany; all-or-nothing."""
+		with self.transaction() as conn:
+			conn.executemany(
+				"""INSERT INTO speculation_results
+				(id, parent_unit_id, winner_branch_id, mission_id, epoch_id,
+				 branch_count, branch_ids, branch_scores,
+				 total_speculation_cost_usd, selection_metric, timestamp)
+				VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+				[
+					(
+						r.id, r.parent_unit_id, r.winner_branch_id,
+						r.mission_id, r.epoch_id,
+						r.branch_count, r.branch_ids, r.branch_scores,
+						r.total_speculation_cost_usd, r.selection_metric,
+						r.timestamp,
+					)
+					for r in results
+				],
+			)
 
 	def get_speculation_results_for_mission(self, mission_id: str) -> list[SpeculationResult]:
 		rows = self.conn.execute(
@@ -3057,16 +3103,23 @@ class Database:
 	# -- Prompt Variants --
 
 	def insert_prompt_variant(self, v: PromptVariant) -> None:
-		self.conn.execute(
-			"""INSERT INTO prompt_variants
-			(id, component, variant_id, content, win_rate, sample_count, created_at, parent_variant_id)
-			VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-			(
-				v.id, v.component, v.variant_id, v.content,
-				v.win_rate, v.sample_count, v.created_at, v.parent_variant_id,
-			),
-		)
-		self.conn.commit()
+		self.insert_prompt_variants([v])
+
+	def insert_prompt_variants(self, variants: Sequence[PromptVariant]) -> None:
+		"""Insert variants in one executemany; all-or-nothing."""
+		with self.transaction() as conn:
+			conn.executemany(
+				"""INSERT INTO prompt_variants
+				(id, component, variant_id, content, win_rate, sample_count, created_at, parent_variant_id)
+				VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+				[
+					(
+						v.id, v.component, v.variant_id, v.content,
+						v.win_rate, v.sample_count, v.created_at, v.parent_variant_id,
+					)
+					for v in variants
+				],
+			)
 
 	def update_prompt_variant(self, v: PromptVariant) -> None:
 		self.conn.execute(
@@ -3112,13 +3165,17 @@ class Database:
 	# -- Prompt Outcomes --
 
 	def insert_prompt_outcome(self, o: PromptOutcome) -> None:
-		self.conn.execute(
-			"""INSERT INTO prompt_outcomes
-			(id, variant_id, outcome, context, recorded_at)
-			VALUES (?, ?, ?, ?, ?)""",
-			(o.id, o.variant_id, o.outcome, o.context, o.recorded_at),
-		)
-		self.conn.commit()
+		self.insert_prompt_outcomes([o])
+
+	def insert_prompt_outcomes(self, outcomes: Sequence[PromptOutcome]) -> None:
+		"""Insert outcomes in one executemany; all-or-nothing."""
+		with self.transaction() as conn:
+			conn.executemany(
+				"""INSERT INTO prompt_outcomes
+				(id, variant_id, outcome, context, recorded_at)
+				VALUES (?, ?, ?, ?, ?)""",
+				[(o.id, o.variant_id, o.outcome, o.context, o.recorded_at) for o in outcomes],
+			)
 
 	def get_prompt_outcomes_for_variant(self, variant_id: str) -> list[PromptOutcome]:
 		rows = self.conn.execute(
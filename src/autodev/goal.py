@@ -75,6 +75,14 @@ class IterationEntry:
 # Parsing
 # ---------------------------------------------------------------------------
 
+_GOAL_HEADING_RE = re.compile(r"^#\s+Goal:\s*(.+)$", re.MULTILINE)
+_SECTION_HEADING_RE = re.compile(r"^##\s+(\w+)\s*$", re.MULTILINE)
+_FLOAT_RE = re.compile(r"(\d+\.?\d*)")
+_COMPONENT_RE = re.compile(r"^-\s+(.+?)\s+\(weight:\s*([\d.]+)\):\s*(.+)$", re.MULTILINE)
+_FILES_TAG_RE = re.compile(r"\[files?:\s*([^\]]+)\]")
+_IMPACT_TAG_RE = re.compile(r"\[impact:\s*(\w+)\]")
+
+
 def parse_goal_file(path: Path) -> GoalSpec:
 	"""Parse a GOAL.md file into a GoalSpec.
 
@@ -88,15 +96,14 @@ def parse_goal_file(path: Path) -> GoalSpec:
 def _parse_goal_text(text: str) -> GoalSpec:
 	"""Parse GOAL.md text content into GoalSpec."""
 	# Extract goal name from first heading
-	name_match = re.search(r"^#\s+Goal:\s*(.+)$", text, re.MULTILINE)
+	name_match = _GOAL_HEADING_RE.search(text)
 	if not name_match:
 		raise ValueError("GOAL.md must have a '# Goal: <name>' heading")
 	name = name_match.group(1).strip()
 
 	# Split into sections by ## headings
 	sections: dict[str, str] = {}
-	section_pattern = re.compile(r"^##\s+(\w+)\s*$", re.MULTILINE)
-	matches = list(section_pattern.finditer(text))
+	matches = list(_SECTION_HEADING_RE.finditer(text))
 	for i, m in enumerate(matches):
 		section_name = m.group(1).lower()
 		start = m.end()
@@ -129,7 +136,7 @@ def _parse_goal_text(text: str) -> GoalSpec:
 			target_score = float(target_text)
 		except ValueError:
 			# Try to extract first float from the text
-			float_match = re.search(r"(\d+\.?\d*)", target_text)
+			float_match = _FLOAT_RE.search(target_text)
 			if float_match:
 				target_score = float(float_match.group(1))
 
@@ -155,11 +162,7 @@ def _parse_components(text: str) -> list[GoalComponent]:
 	if not text.strip():
 		return []
 	components = []
-	pattern = re.compile(
-		r"^-\s+(.+?)\s+\(weight:\s*([\d.]+)\):\s*(.+)$",
-		re.MULTILINE,
-	)
-	for m in pattern.finditer(text):
+	for m in _COMPONENT_RE.finditer(text):
 		components.append(GoalComponent(
 			name=m.group(1).strip(),
 			command=m.group(3).strip(),
@@ -181,14 +184,14 @@ def _parse_actions(text: str) -> list[GoalAction]:
 
 		# Extract [files: ...] tag
 		files_hint: list[str] = []
-		files_match = re.search(r"\[files?:\s*([^\]]+)\]", line)
+		files_match = _FILES_TAG_RE.search(line)
 		if files_match:
 			files_hint = [f.strip() for f in files_match.group(1).split(",")]
 			line = line[:files_match.start()] + line[files_match.end():]
 
 		# Extract [impact: ...] tag
 		impact = "medium"
-		impact_match = re.search(r"\[impact:\s*(\w+)\]", line)
+		impact_match = _IMPACT_TAG_RE.search(line)
 		if impact_match:
 			impact = impact_match.group(1).strip().lower()
 			line = line[:impact_match.start()] + line[impact_match.end():]
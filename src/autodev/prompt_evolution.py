@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
+from typing import Any, Awaitable, Callable
 from uuid import uuid4
 
 from autodev.config import MissionConfig, PromptEvolutionConfig, claude_subprocess_env
@@ -22,10 +23,13 @@ class PromptEvolutionEngine:
 		db: Database,
 		config: PromptEvolutionConfig,
 		mission_config: MissionConfig | None = None,
+		*,
+		subprocess_runner: Callable[..., Awaitable[Any]] = asyncio.create_subprocess_exec,
 	) -> None:
 		self.db = db
 		self.config = config
 		self.mission_config = mission_config
+		self._subprocess_runner = subprocess_runner
 
 	def record_outcome(self, variant_id: str, outcome: str, context: str = "") -> None:
 		"""Record a pass/fail outcome for a variant and recompute win_rate from DB counts."""
@@ -105,7 +109,7 @@ class PromptEvolutionEngine:
 
 		try:
 			from autodev.intelligence.utils import find_claude_binary
-			proc = await asyncio.create_subprocess_exec(
+			proc = await self._subprocess_runner(
 				find_claude_binary(), "-p", "--model", self.config.mutation_model,
 				"--output-format", "text",
 				stdin=asyncio.subprocess.PIPE,
@@ -13,6 +13,9 @@ from autodev.models import MCResultSchema
 
 logger = logging.getLogger(__name__)
 
+_AD_RESULT_MARKER = "AD_RESULT:"
+_SINGLE_LINE_OBJECT_RE = re.compile(r"\{.*\}")
+
 
 def extract_text_from_stream_json(output: str) -> str:
 	"""Extract plain text from stream-json (NDJSON) formatted output.
@@ -80,6 +83,10 @@ def parse_mc_result(output: str) -> dict[str, object] | None:
 	We first try the raw output, then fall back to extracting text from
 	stream-json events.
 	"""
+	# The marker survives JSON string escaping, so without it neither pass can match.
+	if _AD_RESULT_MARKER not in output:
+		return None
+
 	result = _parse_ad_result_from_text(output)
 	if result:
 		return result
@@ -98,12 +105,11 @@ def parse_mc_result(output: str) -> dict[str, object] | None:
 
 def _parse_ad_result_from_text(output: str) -> dict[str, object] | None:
 	"""Extract AD_RESULT JSON from plain text output."""
-	marker = "AD_RESULT:"
-	idx = output.rfind(marker)
+	idx = output.rfind(_AD_RESULT_MARKER)
 	if idx == -1:
 		return None
 
-	remainder = output[idx + len(marker):]
+	remainder = output[idx + len(_AD_RESULT_MARKER):]
 
 	# Try balanced brace extraction (handles multiline JSON)
 	result = extract_json_from_text(remainder)
@@ -111,7 +117,7 @@ def _parse_ad_result_from_text(output: str) -> dict[str, object] | None:
 		return validate_mc_result(result)
 
 	# Fallback: single-line regex for simple cases
-	match = re.search(r"\{.*\}", remainder.split("\n")[0])
+	match = _SINGLE_LINE_OBJECT_RE.search(remainder.split("\n")[0])
 	if match:
 		try:
 			raw = json.loads(match.group(0))
@@ -18,7 +18,7 @@ import re
 import tempfile
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from autodev.session import extract_text_from_stream_json
 from autodev.session_trace import attach_git_note, extract_trace_summary
@@ -63,6 +63,7 @@ class SwarmController:
 		db: Database,
 		task_claim_timeout: float = 1800.0,
 		stalled_task_timeout: float = 600.0,
+		clock: Callable[[], float] = time.monotonic,
 	) -> None:
 		self._config = config
 		self._swarm_config = swarm_config
@@ -72,7 +73,8 @@ class SwarmController:
 		self._tasks: dict[str, SwarmTask] = {}
 		self._processes: dict[str, asyncio.subprocess.Process] = {}
 		self._context = ContextSynthesizer(config, db, self._team_name)
-		self._start_time = time.monotonic()
+		self._clock = clock
+		self._start_time = self._clock()
 		self._total_cost_usd = 0.0
 		self._agent_costs: dict[str, float] = {}
 		self._recent_changes: dict[str, list[str]] = {}
@@ -392,7 +394,7 @@ class SwarmController:
 
 	def build_state(self, core_test_results: dict[str, Any] | None = None) -> SwarmState:
 		"""Build current swarm state snapshot for the planner."""
-		wall_time = time.monotonic() - self._start_time
+		wall_time = self._clock() - self._start_time
 		capabilities = getattr(self, "_capabilities", None)
 		return self._context.build_state(
 			agents=self.agents,
@@ -573,7 +575,7 @@ class SwarmController:
 			logger.info("Spawned agent %s (%s) for task %s", agent.name, role.value, task_id)
 		else:
 			agent.status = AgentStatus.DEAD
-			agent.death_time = time.monotonic()
+			agent.death_time = self._clock()
 			logger.error("Failed to spawn agent %s", agent.name)
 
 		return {"agent_id": agent.id, "name": agent.name, "status": agent.status.value}
@@ -618,7 +620,7 @@ class SwarmController:
 				proc.kill()
 
 		agent.status = AgentStatus.DEAD
-		agent.death_time = time.monotonic()
+		agent.death_time = self._clock()
 		if agent.current_task_id and agent.current_task_id in self._tasks:
 			task = self._tasks[agent.current_task_id]
 			if task.status in (TaskStatus.CLAIMED, TaskStatus.IN_PROGRESS):
@@ -1097,7 +1099,7 @@ class SwarmController:
 					tool_name = content["name"]
 					pending_tool_uses[tool_id] = {
 						"name": tool_name,
-						"start_time": time.monotonic(),
+						"start_time": self._clock(),
 						"mcp_server": tool_name.split("__")[1] if "__" in tool_name else "",
 					}
 
@@ -1108,7 +1110,7 @@ class SwarmController:
 					tool_id = content.get("tool_use_id", "")
 					if tool_id in pending_tool_uses:
 						info = pending_tool_uses.pop(tool_id)
-						duration = (time.monotonic() - info["start_time"]) * 1000
+						duration = (self._clock() - info["start_time"]) * 1000
 						result_text = ""
 						if isinstance(content.get("content"), str):
 							result_text = content["content"]
@@ -1212,7 +1214,7 @@ class SwarmController:
 					self._agent_costs[agent.name] = self._agent_costs.get(agent.name, 0.0) + agent_cost
 
 				agent.status = AgentStatus.DEAD
-				agent.death_time = time.monotonic()
+				agent.death_time = self._clock()
 				if status == "completed":
 					agent.tasks_completed += 1
 					self.circuit_breaker.record_success(agent.current_task_id)
@@ -1472,7 +1474,7 @@ class SwarmController:
 
 		Moves cleaned-up agents to a bounded history list for context rendering.
 		"""
-		now = time.monotonic()
+		now = self._clock()
 		to_remove: list[str] = []
 
 		for agent_id, agent in self._agents.items():
@@ -1718,7 +1720,7 @@ class SwarmController:
 
 	async def _generate_completion_report(self) -> str:
 		"""Generate a swarm completion report."""
-		duration = time.monotonic() - self._start_time
+		duration = self._clock() - self._start_time
 		completed = [t for t in self._tasks.values() if t.status == TaskStatus.COMPLETED]
 		failed = [t for t in self._tasks.values() if t.status == TaskStatus.FAILED]
 
@@ -1905,7 +1907,7 @@ class SwarmController:
 		await self._record_metrics()
 		completed = [t for t in self._tasks.values() if t.status == TaskStatus.COMPLETED]
 		failed = [t for t in self._tasks.values() if t.status == TaskStatus.FAILED]
-		duration = int((time.monotonic() - self._start_time) / 60)
+		duration = int((self._clock() - self._start_time) / 60)
 		await self._notify(
 			f"[autodev] Swarm finished ({duration}m)\n"
 			f"Completed: {len(completed)}, Failed: {len(failed)}\n"
@@ -1925,7 +1927,7 @@ class SwarmController:
 			completed = [t for t in self._tasks.values() if t.status == TaskStatus.COMPLETED]
 			failed = [t for t in self._tasks.values() if t.status == TaskStatus.FAILED]
 			total_tasks = len(completed) + len(failed)
-			duration = time.monotonic() - self._start_time
+			duration = self._clock() - self._start_time
 
 			# Agent success rate: completed agents / total finished agents
 			finished_agents = [
@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+	from collections.abc import Callable
+
 	from autodev.config import MissionConfig
 
 
@@ -64,6 +66,8 @@ class ToolRegistry:
 		self._config = config
 		self._tools_dir = workspace / config.tool_synthesis.tools_dir
 		self._tools: dict[str, ToolEntry] = {}
+		# Rendered prompt sections, invalidated whenever the tool set changes
+		self._rendered: dict[str, str] = {}
 		self._load_existing()
 
 	def _load_existing(self) -> None:
@@ -71,12 +75,17 @@ class ToolRegistry:
 		if not self._tools_dir.is_dir():
 			return
 		for script_path in sorted(self._tools_dir.glob("*.py")):
-			name = script_path.stem
-			description = ""
-			first_line = script_path.read_text().split("\n", 1)[0]
-			if first_line.startswith("#"):
-				description = first_line.lstrip("# ").strip()
-			self._tools[name] = ToolEntry(name=name, description=description, script_path=script_path)
+			with open(script_path) as f:
+				first_line = f.readline()
+			self._tools[script_path.stem] = self._parse_script(script_path, first_line)
+
+	@staticmethod
+	def _parse_script(script_path: Path, first_line: str) -> ToolEntry:
+		"""Build a ToolEntry from a script's path and its leading '# description' comment."""
+		description = ""
+		if first_line.startswith("#"):
+			description = first_line.lstrip("# ").strip()
+		return ToolEntry(name=script_path.stem, description=description, script_path=script_path)
 
 	@staticmethod
 	def _validate_script_content_static(content: str) -> None:
@@ -152,6 +161,7 @@ class ToolRegistry:
 
 		entry = ToolEntry(name=name, description=description, script_path=script_path)
 		self._tools[name] = entry
+		self._rendered.clear()
 		return entry
 
 	def get_tool(self, name: str) -> ToolEntry | None:
@@ -173,11 +183,22 @@ class ToolRegistry:
 		"""
 		return sorted(self._tools.values(), key=lambda t: t.name)
 
+	def cached_section(self, key: str, build: Callable[[], str]) -> str:
+		"""Return the prompt section cached under *key*, building it on first use.
+
+		The cache is cleared whenever the tool set changes.
+		"""
+		section = self._rendered.get(key)
+		if section is None:
+			section = self._rendered[key] = build()
+		return section
+
 	def cleanup_all(self) -> None:
 		"""Remove all registered tools and delete the tools directory."""
 		if self._tools_dir.is_dir():
 			shutil.rmtree(self._tools_dir)
 		self._tools.clear()
+		self._rendered.clear()
 
 
 def render_tool_reflection_section(registry: ToolRegistry) -> str:
@@ -189,6 +210,10 @@ def render_tool_reflection_section(registry: ToolRegistry) -> str:
 	Returns:
 		Formatted prompt section string.
 	"""
+	return registry.cached_section("reflection", lambda: _build_tool_reflection_section(registry))
+
+
+def _build_tool_reflection_section(registry: ToolRegistry) -> str:
 	section = TOOL_REFLECTION_PROMPT
 	tools = registry.list_tools()
 	if tools:
@@ -210,6 +235,10 @@ def render_available_tools_section(registry: ToolRegistry) -> str:
 	Returns:
 		Formatted tools section string, or empty string if no tools exist.
 	"""
+	return registry.cached_section("available", lambda: _build_available_tools_section(registry))
+
+
+def _build_available_tools_section(registry: ToolRegistry) -> str:
 	tools = registry.list_tools()
 	if not tools:
 		return ""
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import json
 import threading
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -51,13 +52,21 @@ class TraceLogger:
 		return self._config.enabled
 
 	def write(self, event: TraceEvent) -> None:
-		if not self._config.enabled:
+		self.write_many((event,))
+
+	def write_many(self, events: Sequence[TraceEvent]) -> None:
+		"""Append events with a single lock acquisition, rotation check and write.
+
+		Rotation is checked once per batch, so a batch may run past max_file_size.
+		"""
+		if not self._config.enabled or not events:
 			return
+		payload = "".join(json.dumps(event.to_dict()) + "\n" for event in events)
 		with self._lock:
 			path = Path(self._config.path)
 			self._maybe_rotate(path)
 			with open(path, "a") as f:
-				f.write(json.dumps(event.to_dict()) + "\n")
+				f.write(payload)
 
 	def close(self) -> None:
 		"""No-op: file handles are not held open between writes."""
@@ -635,6 +635,14 @@ AD_RESULT:{{"status":"completed|failed|blocked","commits":["hash"],\
 """
 
 
+_UNIT_TYPE_TEMPLATES: dict[str, str] = {
+	"research": RESEARCH_WORKER_PROMPT_TEMPLATE,
+	"experiment": EXPERIMENT_WORKER_PROMPT_TEMPLATE,
+	"audit": AUDIT_WORKER_PROMPT_TEMPLATE,
+	"design": DESIGN_WORKER_PROMPT_TEMPLATE,
+}
+
+
 def _build_context_blocks(
 	experience_context: str = "",
 	mission_state: str = "",
@@ -689,16 +697,7 @@ def render_mission_worker_prompt(
 	if goal_context:
 		context = (context or "") + f"\n\n## Goal Fitness\n{_sanitize_braces(goal_context)}\n"
 
-	if unit.unit_type == "research":
-		template = RESEARCH_WORKER_PROMPT_TEMPLATE
-	elif unit.unit_type == "experiment":
-		template = EXPERIMENT_WORKER_PROMPT_TEMPLATE
-	elif unit.unit_type == "audit":
-		template = AUDIT_WORKER_PROMPT_TEMPLATE
-	elif unit.unit_type == "design":
-		template = DESIGN_WORKER_PROMPT_TEMPLATE
-	else:
-		template = MISSION_WORKER_PROMPT_TEMPLATE
+	template = _UNIT_TYPE_TEMPLATES.get(unit.unit_type, MISSION_WORKER_PROMPT_TEMPLATE)
 	rendered = template.format(
 		target_name=config.target.name,
 		workspace_path=workspace_path,
@@ -1159,7 +1158,11 @@ class WorkerAgent:
 		"""Periodically update heartbeat in the DB."""
 		while True:
 			await asyncio.sleep(self.heartbeat_interval)
-			await self.db.locked_call("update_heartbeat", self.worker.id)
+			await self._heartbeat_once()
+
+	async def _heartbeat_once(self) -> None:
+		"""Record a heartbeat for this worker and the units it holds."""
+		await self.db.locked_call("update_heartbeat", self.worker.id)
 
 	async def _run_git(self, *args: str, cwd: str) -> bool:
 		"""Run a git command, logging output on failure."""
@@ -10,21 +10,27 @@ from autodev.config import MissionConfig, ResearchConfig, TargetConfig, Verifica
 from autodev.db import Database
 
 
+@pytest.fixture(scope="session")
+def db_template() -> Database:
+	"""Schema-initialized Database that per-test databases are copied from."""
+	return Database(":memory:")
+
+
 @pytest.fixture()
-def db() -> Database:
+def db(db_template: Database) -> Database:
 	"""In-memory Database with schema initialized."""
-	return Database(":memory:")
+	return Database(":memory:", template=db_template)
 
 
 @pytest.fixture()
 def config(tmp_path: Any) -> MissionConfig:
 	"""Minimal MissionConfig with TargetConfig pointing to a tmp_path git repo."""
-	cfg = MissionConfig()
-	cfg.target = TargetConfig(
-		name="test-proj",
-		path=str(tmp_path),
-		branch="main",
-		verification=VerificationConfig(command="pytest -q"),
+	return MissionConfig(
+		target=TargetConfig(
+			name="test-proj",
+			path=str(tmp_path),
+			branch="main",
+			verification=VerificationConfig(command="pytest -q"),
+		),
+		research=ResearchConfig(enabled=False),
 	)
-	cfg.research = ResearchConfig(enabled=False)
-	return cfg
@@ -18,11 +18,6 @@ from autodev.intelligence.models import AdaptationProposal, Finding
 # -- Fixtures --
 
 
-@pytest.fixture
-def db() -> Database:
-	return Database(":memory:")
-
-
 @pytest.fixture
 def config() -> MissionConfig:
 	"""Minimal MissionConfig with Telegram settings."""
@@ -2,10 +2,6 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
-import pytest
-
 from autodev.causal import (
 	CausalAttributor,
 	CausalSignal,
@@ -16,13 +12,6 @@ from autodev.db import Database
 from autodev.models import WorkUnit
 
 
-@pytest.fixture
-def db(tmp_path: Path) -> Database:
-	d = Database(tmp_path / "test.db")
-	yield d
-	d.close()
-
-
 class TestCausalSignalDefaults:
 	def test_default_fields(self) -> None:
 		s = CausalSignal()
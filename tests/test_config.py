@@ -105,6 +105,12 @@ def test_config_file_not_found() -> None:
 		load_config("/nonexistent/path.toml")
 
 
+def test_load_config_sees_rewritten_file(minimal_config: Path) -> None:
+	assert load_config(minimal_config).target.name == "tiny"
+	minimal_config.write_text('[target]\nname = "renamed-project"\npath = "/tmp/tiny"\n')
+	assert load_config(minimal_config).target.name == "renamed-project"
+
+
 def test_resolved_path(minimal_config: Path) -> None:
 	cfg = load_config(minimal_config)
 	assert cfg.target.resolved_path == Path("/tmp/tiny")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import tempfile
 import time
 from pathlib import Path
 from typing import Any
@@ -11,8 +12,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from autodev.backends import LocalBackend
-from autodev.config import MissionConfig
+from autodev.backends import LocalBackend, WorkerBackend, WorkerHandle
+from autodev.config import MissionConfig, ReviewConfig
 from autodev.continuous_controller import (
 	ContinuousController,
 	ContinuousMissionResult,
@@ -37,6 +38,40 @@ def _assert_semaphore_available(sem: asyncio.Semaphore | DynamicSemaphore, expec
 	assert actual == expected, f"Expected {expected} available permits, got {actual}"
 
 
+class _NullBackend(WorkerBackend):
+	"""Backend stub for orchestration tests that mock out unit execution."""
+
+	async def provision_workspace(self, worker_id: str, source_repo: str, base_branch: str) -> str:
+		return ""
+
+	async def spawn(self, worker_id: str, workspace_path: str, command: list[str], timeout: int) -> WorkerHandle:
+		return WorkerHandle(worker_id=worker_id, workspace_path=workspace_path)
+
+	async def check_status(self, handle: WorkerHandle) -> str:
+		return "completed"
+
+	async def get_output(self, handle: WorkerHandle) -> str:
+		return ""
+
+	async def kill(self, handle: WorkerHandle) -> None:
+		pass
+
+	async def release_workspace(self, workspace_path: str) -> None:
+		pass
+
+	async def cleanup(self) -> None:
+		pass
+
+
+def _seed_epoch(db: Database) -> Epoch:
+	"""Insert mission m1, plan p1 and epoch ep1, returning the epoch."""
+	db.insert_mission(Mission(id="m1", objective="test"))
+	db.insert_plan(Plan(id="p1", objective="test"))
+	epoch = Epoch(id="ep1", mission_id="m1", number=1)
+	db.insert_epoch(epoch)
+	return epoch
+
+
 class TestShouldStop:
 	def test_running_false(self, config: MissionConfig, db: Database) -> None:
 		ctrl = ContinuousController(config, db)
@@ -430,11 +465,7 @@ class TestExecuteSingleUnit:
 	@pytest.mark.asyncio
 	async def test_provision_failure_queues_failed_completion(self, config: MissionConfig, db: Database) -> None:
 		"""When workspace provisioning fails, a failed completion is queued."""
-		db.insert_mission(Mission(id="m1", objective="test"))
-		plan = Plan(id="p1", objective="test")
-		db.insert_plan(plan)
-		epoch = Epoch(id="ep1", mission_id="m1", number=1)
-		db.insert_epoch(epoch)
+		epoch = _seed_epoch(db)
 
 		ctrl = ContinuousController(config, db)
 
@@ -463,11 +494,7 @@ class TestCriteriaValidation:
 	def _make_ctrl(
 		self, config: MissionConfig, db: Database, tmp_path: Path,
 	) -> tuple[ContinuousController, WorkUnit, Epoch]:
-		db.insert_mission(Mission(id="m1", objective="test"))
-		plan = Plan(id="p1", objective="test")
-		db.insert_plan(plan)
-		epoch = Epoch(id="ep1", mission_id="m1", number=1)
-		db.insert_epoch(epoch)
+		epoch = _seed_epoch(db)
 
 		ctrl = ContinuousController(config, db)
 
@@ -650,7 +677,7 @@ class TestEndToEnd:
 		async def mock_init() -> None:
 			ctrl._planner = mock_planner
 			ctrl._green_branch = mock_gbm
-			ctrl._backend = AsyncMock()
+			ctrl._backend = _NullBackend()
 			ctrl._notifier = None
 			ctrl._heartbeat = None
 			ctrl._event_stream = None
@@ -848,8 +875,6 @@ class TestVenvSymlink:
 	@pytest.mark.asyncio
 	async def test_venv_symlinked_when_exists(self, config: MissionConfig, db: Database) -> None:
 		"""Source .venv should be symlinked into green branch workspace."""
-		import tempfile
-
 		ctrl = ContinuousController(config, db)
 
 		with tempfile.TemporaryDirectory() as source_repo:
@@ -891,38 +916,37 @@ class TestWorkerRecordPersistence:
 	@pytest.fixture()
 	def worker_env(self, config: MissionConfig, db: Database):
 		"""Set up controller, epoch, and mock build_claude_cmd with automatic teardown."""
-		db.insert_mission(Mission(id="m1", objective="test"))
-		plan = Plan(id="p1", objective="test")
-		db.insert_plan(plan)
-		epoch = Epoch(id="ep1", mission_id="m1", number=1)
-		db.insert_epoch(epoch)
+		epoch = _seed_epoch(db)
 
 		ctrl = ContinuousController(config, db)
 
 		async def mock_locked_call(method: str, *args: object) -> object:
 			return getattr(db, method)(*args)
 		db.locked_call = mock_locked_call  # type: ignore[attr-defined]
+		ctrl._semaphore = DynamicSemaphore(1)
 
 		with patch("autodev.continuous_controller.build_claude_cmd", return_value=["echo", "test"]):
 			yield db, ctrl, epoch
 
+	@pytest.fixture()
+	def completed_backend(self):
+		"""Factory for a backend mock whose spawned worker completes with the given output."""
+		def _make(workspace_path: str, output: str = "") -> AsyncMock:
+			backend = AsyncMock()
+			backend.spawn.return_value = MagicMock(pid=42, workspace_path=workspace_path)
+			backend.check_status.return_value = "completed"
+			backend.get_output.return_value = output
+			return backend
+		return _make
+
 	@pytest.mark.asyncio
-	async def test_worker_created_on_spawn(self, worker_env) -> None:
+	async def test_worker_created_on_spawn(self, worker_env, completed_backend) -> None:
 		"""Worker record is inserted after backend.spawn() succeeds."""
 		db, ctrl, epoch = worker_env
-
-		mock_backend = AsyncMock()
-		mock_handle = MagicMock()
-		mock_handle.pid = 42
-		mock_handle.workspace_path = "/tmp/ws/wu1"
-		mock_backend.spawn.return_value = mock_handle
-		mock_backend.check_status.return_value = "completed"
-		mock_backend.get_output.return_value = ""
-		ctrl._backend = mock_backend
+		ctrl._backend = completed_backend("/tmp/ws/wu1")
 
 		unit = WorkUnit(id="wu1", plan_id="p1", title="Task")
 		db.insert_work_unit(unit)
-		ctrl._semaphore = DynamicSemaphore(1)
 
 		await ctrl._execute_single_unit(unit, epoch, Mission(id="m1"))
 
@@ -932,7 +956,7 @@ class TestWorkerRecordPersistence:
 		assert worker.backend_type == "local"
 
 	@pytest.mark.asyncio
-	async def test_worker_idle_on_completion(self, worker_env) -> None:
+	async def test_worker_idle_on_completion(self, worker_env, completed_backend) -> None:
 		"""Worker status set to idle after successful completion."""
 		db, ctrl, epoch = worker_env
 
@@ -940,20 +964,10 @@ class TestWorkerRecordPersistence:
 			"status": "completed", "commits": ["abc123"],
 			"summary": "Done", "files_changed": [], "discoveries": [], "concerns": [],
 		})
-		output = f"AD_RESULT:{mc_result}"
-
-		mock_backend = AsyncMock()
-		mock_handle = MagicMock()
-		mock_handle.pid = 42
-		mock_handle.workspace_path = "/tmp/ws"
-		mock_backend.spawn.return_value = mock_handle
-		mock_backend.check_status.return_value = "completed"
-		mock_backend.get_output.return_value = output
-		ctrl._backend = mock_backend
+		ctrl._backend = completed_backend("/tmp/ws", f"AD_RESULT:{mc_result}")
 
 		unit = WorkUnit(id="wu1", plan_id="p1", title="Task")
 		db.insert_work_unit(unit)
-		ctrl._semaphore = DynamicSemaphore(1)
 
 		await ctrl._execute_single_unit(unit, epoch, Mission(id="m1"))
 
@@ -971,11 +985,7 @@ class TestFailUnitHelper:
 	@pytest.mark.asyncio
 	async def test_updates_unit_and_worker_and_queues(self, config: MissionConfig, db: Database) -> None:
 		"""_fail_unit should update unit status, worker status, and put completion on queue."""
-		db.insert_mission(Mission(id="m1", objective="test"))
-		plan = Plan(id="p1", objective="test")
-		db.insert_plan(plan)
-		epoch = Epoch(id="ep1", mission_id="m1", number=1)
-		db.insert_epoch(epoch)
+		epoch = _seed_epoch(db)
 
 		ctrl = ContinuousController(config, db)
 
@@ -1083,7 +1093,7 @@ class TestSequentialOrchestration:
 			unit: WorkUnit, epoch: Epoch, mission: Mission,
 		) -> WorkerCompletion | None:
 			events.append(f"exec:{unit.id}")
-			await asyncio.sleep(0.01)
+			await asyncio.sleep(0)
 			unit.status = "completed"
 			unit.commit_hash = "abc123"
 			unit.branch_name = f"mc/unit-{unit.id}"
@@ -1129,7 +1139,7 @@ class TestSequentialOrchestration:
 		async def mock_init() -> None:
 			ctrl._planner = mock_planner
 			ctrl._green_branch = mock_gbm
-			ctrl._backend = AsyncMock()
+			ctrl._backend = _NullBackend()
 			ctrl._notifier = None
 			ctrl._heartbeat = None
 			ctrl._event_stream = None
@@ -1381,7 +1391,7 @@ class TestAmbitionScoringInDispatch:
 		async def mock_init() -> None:
 			ctrl._planner = mock_planner
 			ctrl._green_branch = mock_gbm
-			ctrl._backend = AsyncMock()
+			ctrl._backend = _NullBackend()
 			ctrl._notifier = None
 			ctrl._heartbeat = None
 			ctrl._event_stream = None
@@ -1455,7 +1465,7 @@ class TestInFlightUnitsPreventPrematureCompletion:
 		async def mock_init() -> None:
 			ctrl._planner = mock_planner
 			ctrl._green_branch = mock_gbm
-			ctrl._backend = AsyncMock()
+			ctrl._backend = _NullBackend()
 			ctrl._notifier = None
 			ctrl._heartbeat = None
 			ctrl._event_stream = None
@@ -1907,7 +1917,7 @@ class TestLayerByLayerDispatch:
 			unit: WorkUnit, epoch: Epoch, mission: Mission,
 		) -> WorkerCompletion | None:
 			events.append(f"start:{unit.id}")
-			await asyncio.sleep(0.02)
+			await asyncio.sleep(0)
 			events.append(f"end:{unit.id}")
 			unit.status = "completed"
 			unit.commit_hash = "abc123"
@@ -1950,7 +1960,7 @@ class TestLayerByLayerDispatch:
 		async def mock_init() -> None:
 			ctrl._planner = mock_planner
 			ctrl._green_branch = mock_gbm
-			ctrl._backend = AsyncMock()
+			ctrl._backend = _NullBackend()
 			ctrl._notifier = None
 			ctrl._heartbeat = None
 			ctrl._event_stream = None
@@ -1988,7 +1998,7 @@ class TestLayerByLayerDispatch:
 			unit: WorkUnit, epoch: Epoch, mission: Mission,
 		) -> WorkerCompletion | None:
 			events.append(f"start:{unit.id}")
-			await asyncio.sleep(0.02)
+			await asyncio.sleep(0)
 			events.append(f"end:{unit.id}")
 			unit.status = "completed"
 			unit.commit_hash = "abc123"
@@ -2030,7 +2040,7 @@ class TestLayerByLayerDispatch:
 		async def mock_init() -> None:
 			ctrl._planner = mock_planner
 			ctrl._green_branch = mock_gbm
-			ctrl._backend = AsyncMock()
+			ctrl._backend = _NullBackend()
 			ctrl._notifier = None
 			ctrl._heartbeat = None
 			ctrl._event_stream = None
@@ -2259,7 +2269,6 @@ class TestReviewerSkip:
 
 	def test_review_default_model_is_haiku(self) -> None:
 		"""Verify the default review model changed to haiku."""
-		from autodev.config import ReviewConfig
 		rc = ReviewConfig()
 		assert rc.model == "haiku"
 		assert rc.budget_per_review_usd == 0.05
@@ -2267,7 +2276,6 @@ class TestReviewerSkip:
 
 	def test_review_skip_when_criteria_passed_default(self) -> None:
 		"""skip_when_criteria_passed defaults to True."""
-		from autodev.config import ReviewConfig
 		rc = ReviewConfig()
 		assert rc.skip_when_criteria_passed is True
 
@@ -2839,11 +2847,7 @@ class TestExecuteBatch:
 	@pytest.mark.asyncio
 	async def test_collects_completions_from_units(self, config: MissionConfig, db: Database) -> None:
 		"""Batch should collect WorkerCompletion objects returned by _execute_single_unit."""
-		db.insert_mission(Mission(id="m1", objective="test"))
-		plan = Plan(id="p1", objective="test")
-		db.insert_plan(plan)
-		epoch = Epoch(id="ep1", mission_id="m1", number=1)
-		db.insert_epoch(epoch)
+		epoch = _seed_epoch(db)
 		ctrl = ContinuousController(config, db)
 		ctrl._backend = MagicMock()
 		ctrl._semaphore = DynamicSemaphore(2)
@@ -2869,15 +2873,10 @@ class TestProcessBatch:
 	@pytest.mark.asyncio
 	async def test_processes_all_completions(self, config: MissionConfig, db: Database) -> None:
 		"""_process_batch should call _process_single_completion for each item."""
-		db.insert_mission(Mission(id="m1", objective="test"))
+		epoch = _seed_epoch(db)
 		ctrl = ContinuousController(config, db)
 		ctrl._green_branch = MagicMock()
 
-		epoch = Epoch(id="ep1", mission_id="m1", number=1)
-		plan = Plan(id="p1", objective="test")
-		db.insert_plan(plan)
-		db.insert_epoch(epoch)
-
 		completions = [
 			WorkerCompletion(
 				unit=WorkUnit(id=f"wu{i}", plan_id="p1", title=f"Task {i}", status="completed"),
@@ -21,6 +21,7 @@ from autodev.models import (
 	Plan,
 	Session,
 	Snapshot,
+	StrategicContext,
 	TrajectoryRating,
 	UnitEvent,
 	UnitReview,
@@ -148,6 +149,24 @@ class TestPlans:
 	def test_get_nonexistent(self, db: Database) -> None:
 		assert db.get_plan("nope") is None
 
+	def test_persist_plan_with_units(self, db: Database) -> None:
+		plan = Plan(id="p1", objective="Build API")
+		db.persist_plan(plan, [
+			WorkUnit(id="a", plan_id="p1", title="A"),
+			WorkUnit(id="b", plan_id="p1", title="B"),
+		])
+		assert db.get_plan("p1") is not None
+		assert [u.id for u in db.get_work_units_for_plan("p1")] == ["a", "b"]
+
+	def test_persist_plan_is_atomic(self, db: Database) -> None:
+		plan = Plan(id="p1", objective="Build API")
+		with pytest.raises(sqlite3.IntegrityError):
+			db.persist_plan(plan, [
+				WorkUnit(id="a", plan_id="p1", title="A"),
+				WorkUnit(id="a", plan_id="p1", title="Duplicate"),
+			])
+		assert db.get_plan("p1") is None
+
 
 class TestWorkUnits:
 	def _make_plan(self, db: Database, plan_id: str = "plan1") -> None:
@@ -163,6 +182,15 @@ class TestWorkUnits:
 		assert result.status == "pending"
 		assert result.attempt == 0
 
+	def test_insert_work_units_is_atomic(self, db: Database) -> None:
+		self._make_plan(db)
+		with pytest.raises(sqlite3.IntegrityError):
+			db.insert_work_units([
+				WorkUnit(id="a", plan_id="plan1", title="A"),
+				WorkUnit(id="a", plan_id="plan1", title="Duplicate"),
+			])
+		assert db.get_work_units_for_plan("plan1") == []
+
 	def test_update_work_unit(self, db: Database) -> None:
 		self._make_plan(db)
 		wu = WorkUnit(id="wu2", plan_id="plan1", title="Lint")
@@ -453,8 +481,7 @@ class TestMissionSummary:
 			),
 		]
 		db.insert_plan(Plan(id="p1", objective="Build API"))
-		for u in units:
-			db.insert_work_unit(u)
+		db.insert_work_units(units)
 
 		events = [
 			UnitEvent(id="ev1", mission_id="m1", epoch_id="ep1", work_unit_id="wu1", event_type="dispatched"),
@@ -592,6 +619,23 @@ class TestMigrationIdempotency:
 		db._create_tables()
 
 
+class TestTemplateClone:
+	def test_clone_has_schema(self, db_template: Database) -> None:
+		db = Database(":memory:", template=db_template)
+		db.insert_mission(Mission(id="m1", objective="test"))
+		assert db.get_mission("m1") is not None
+
+	def test_clone_does_not_write_back_to_template(self, db_template: Database) -> None:
+		db = Database(":memory:", template=db_template)
+		db.insert_session(Session(id="tpl-s1", target_name="proj"))
+		assert db_template.get_session("tpl-s1") is None
+
+	def test_clone_enforces_foreign_keys(self, db_template: Database) -> None:
+		db = Database(":memory:", template=db_template)
+		row = db.conn.execute("PRAGMA foreign_keys").fetchone()
+		assert row[0] == 1
+
+
 class TestBusyTimeout:
 	def test_busy_timeout_set_on_file_db(self, tmp_path: Any) -> None:
 		"""busy_timeout pragma should be set to 5000 for file-based DBs."""
@@ -672,12 +716,12 @@ class TestMissionChainId:
 
 	def test_get_missions_for_chain(self, db: Database) -> None:
 		"""get_missions_for_chain returns correct missions ordered by started_at."""
-		db.insert_mission(Mission(id="m1", objective="First", chain_id="chain-1", started_at="2025-01-01T00:00:00"))
-		db.insert_mission(Mission(id="m2", objective="Second", chain_id="chain-1", started_at="2025-01-02T00:00:00"))
-		db.insert_mission(Mission(
-			id="m3", objective="Other chain", chain_id="chain-2", started_at="2025-01-01T12:00:00",
-		))
-		db.insert_mission(Mission(id="m4", objective="Third", chain_id="chain-1", started_at="2025-01-03T00:00:00"))
+		db.insert_missions([
+			Mission(id="m1", objective="First", chain_id="chain-1", started_at="2025-01-01T00:00:00"),
+			Mission(id="m2", objective="Second", chain_id="chain-1", started_at="2025-01-02T00:00:00"),
+			Mission(id="m3", objective="Other chain", chain_id="chain-2", started_at="2025-01-01T12:00:00"),
+			Mission(id="m4", objective="Third", chain_id="chain-1", started_at="2025-01-03T00:00:00"),
+		])
 
 		chain1 = db.get_missions_for_chain("chain-1")
 		assert len(chain1) == 3
@@ -692,6 +736,19 @@ class TestMissionChainId:
 		result = db.get_missions_for_chain("no-such-chain")
 		assert result == []
 
+	def test_insert_missions_is_atomic(self, db: Database) -> None:
+		with pytest.raises(sqlite3.IntegrityError):
+			db.insert_missions([Mission(id="m1", objective="A"), Mission(id="m1", objective="Duplicate")])
+		assert db.get_mission("m1") is None
+
+	def test_insert_strategic_contexts(self, db: Database) -> None:
+		db.insert_mission(Mission(id="m1", objective="A"))
+		db.insert_strategic_contexts([
+			StrategicContext(id=f"sc{i}", mission_id="m1", timestamp=f"2025-01-0{i + 1}T00:00:00")
+			for i in range(3)
+		])
+		assert [c.id for c in db.get_strategic_context(limit=2)] == ["sc2", "sc1"]
+
 
 class TestUnitReviews:
 	def _setup(self, db: Database) -> None:
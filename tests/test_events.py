@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -24,13 +25,6 @@ from autodev.event_stream import EventStream
 from autodev.models import Epoch, Mission, Plan, Signal, UnitEvent, WorkUnit, _now_iso
 
 
-@pytest.fixture
-def db():
-	d = Database(":memory:")
-	yield d
-	d.close()
-
-
 @pytest.fixture
 def mission(db):
 	m = Mission(objective="test objective", status="running")
@@ -485,3 +479,16 @@ class TestSignalCRUD:
 
 		pending = db.get_pending_signals(mission.id)
 		assert len(pending) == 1
+
+	def test_expire_respects_timeout_boundary(self, db, mission):
+		now = datetime.now(timezone.utc)
+		for sid, age in (("old", 11), ("recent", 9)):
+			db.insert_signal(Signal(
+				id=sid,
+				mission_id=mission.id,
+				signal_type="stop",
+				created_at=(now - timedelta(minutes=age)).isoformat(),
+			))
+
+		assert db.expire_stale_signals(timeout_minutes=10) == 1
+		assert [s.id for s in db.get_pending_signals(mission.id)] == ["recent"]
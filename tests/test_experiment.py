@@ -16,13 +16,6 @@ from autodev.worker import render_mission_worker_prompt
 # -- DB experiment_results CRUD tests --
 
 
-@pytest.fixture
-def db(tmp_path: Path) -> Database:
-	d = Database(tmp_path / "test.db")
-	yield d
-	d.close()
-
-
 def _create_mission_and_unit(db: Database, mission_id: str, unit_id: str) -> None:
 	"""Helper: insert a mission and work unit to satisfy FK constraints."""
 	from autodev.models import Mission, Plan
@@ -61,9 +54,8 @@ class TestExperimentResultDB:
 		db.insert_mission(mission)
 		plan = Plan(id="plan-multi", objective="test")
 		db.insert_plan(plan)
+		db.insert_work_units([WorkUnit(id=f"wu-{i}", plan_id=plan.id, title=f"unit {i}") for i in range(3)])
 		for i in range(3):
-			unit = WorkUnit(id=f"wu-{i}", plan_id=plan.id, title=f"unit {i}")
-			db.insert_work_unit(unit)
 			db.insert_experiment_result(ExperimentResult(
 				id=f"exp-{i}",
 				work_unit_id=f"wu-{i}",
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import pytest
-
 from autodev.db import Database
 from autodev.feedback import (
 	_extract_keywords,
@@ -20,11 +18,6 @@ from autodev.models import (
 )
 
 
-@pytest.fixture()
-def db() -> Database:
-	return Database(":memory:")
-
-
 class TestGetWorkerContext:
 	def test_matching_experience(self, db: Database) -> None:
 		"""Keywords match an existing experience."""
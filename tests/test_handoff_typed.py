@@ -67,12 +67,6 @@ class TestHandoffModel:
 
 
 class TestHandoffDBRoundTrip:
-	@pytest.fixture()
-	def db(self) -> Database:
-		d = Database()
-		yield d
-		d.close()
-
 	def _seed(self, db: Database) -> None:
 		db.insert_mission(Mission(id="m1", objective="test"))
 		db.insert_plan(Plan(id="p1", objective="test"))
@@ -685,9 +685,7 @@ class TestIsCleanupDue:
 
 	def test_due_after_interval(self, db: Database) -> None:
 		"""After interval non-cleanup missions, cleanup is due."""
-		for i in range(3):
-			m = Mission(objective=f"Mission {i}", status="completed")
-			db.insert_mission(m)
+		db.insert_missions([Mission(objective=f"Mission {i}", status="completed") for i in range(3)])
 		assert _is_cleanup_due(db, interval=3) is True
 
 	def test_not_due_after_recent_cleanup(self, db: Database) -> None:
@@ -703,9 +701,7 @@ class TestIsCleanupDue:
 
 	def test_ignores_running_missions(self, db: Database) -> None:
 		"""Running missions don't count toward the interval."""
-		for i in range(3):
-			m = Mission(objective=f"Mission {i}", status="running")
-			db.insert_mission(m)
+		db.insert_missions([Mission(objective=f"Mission {i}", status="running") for i in range(3)])
 		assert _is_cleanup_due(db, interval=3) is False
 
 
@@ -12,11 +12,6 @@ from autodev.mcp_registry import MCPToolEntry, MCPToolRegistry
 from autodev.tool_synthesis import ToolEntry, promote_to_mcp_registry
 
 
-@pytest.fixture()
-def db() -> Database:
-	return Database(":memory:")
-
-
 @pytest.fixture()
 def registry_config() -> MCPRegistryConfig:
 	return MCPRegistryConfig(enabled=True, promotion_threshold=0.7, ema_alpha=0.3)
@@ -37,11 +37,6 @@ from autodev.models import (
 from autodev.planner_context import build_planner_context
 
 
-@pytest.fixture
-def db() -> Database:
-	return Database(":memory:")
-
-
 @pytest.fixture
 def config(tmp_path) -> MissionConfig:
 	mc = MissionConfig()
@@ -203,6 +198,13 @@ class TestCompressHistory:
 		assert "... and" in result
 		assert "more sessions" in result
 
+	def test_large_history_keeps_only_budgeted_prefix(self):
+		sessions = [_make_session(id=f"s{i}", status="completed", desc=f"task {i}") for i in range(1_000)]
+		lines = compress_history(sessions, max_chars=100).split("\n")
+		kept = lines[:-1]
+		assert kept == [f"s{i}: task {i} -> completed" for i in range(len(kept))]
+		assert lines[-1] == f"... and {1_000 - len(kept)} more sessions"
+
 
 # -- Context CRUD --
 
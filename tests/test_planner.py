@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import json
+from dataclasses import replace
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from autodev.config import ContinuousConfig, MissionConfig, PlannerConfig, SchedulerConfig, TargetConfig
+from autodev.config import MissionConfig, PlannerConfig, SchedulerConfig, TargetConfig
 from autodev.continuous_planner import ContinuousPlanner
 from autodev.db import Database
 from autodev.models import Epoch, Handoff, Mission, Plan, WorkUnit
@@ -111,8 +113,8 @@ class TestParsePlannerOutput:
 # -- plan_round tests --
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestPlanRound:
-	@pytest.mark.asyncio
 	async def test_plan_round_returns_plan_and_units(self) -> None:
 		"""plan_round returns (Plan, list[WorkUnit]) directly."""
 		planner = _planner()
@@ -135,7 +137,6 @@ class TestPlanRound:
 		assert units[0].plan_id == plan.id
 		assert units[1].plan_id == plan.id
 
-	@pytest.mark.asyncio
 	async def test_plan_round_empty_units(self) -> None:
 		"""Empty units list means objective is met."""
 		planner = _planner()
@@ -147,7 +148,6 @@ class TestPlanRound:
 		assert plan.total_units == 0
 		assert units == []
 
-	@pytest.mark.asyncio
 	async def test_plan_round_resolves_depends_on_indices(self) -> None:
 		"""depends_on_indices are resolved to WorkUnit IDs."""
 		planner = _planner()
@@ -167,7 +167,6 @@ class TestPlanRound:
 		assert units[1].depends_on == units[0].id
 		assert units[2].depends_on == f"{units[0].id},{units[1].id}"
 
-	@pytest.mark.asyncio
 	async def test_plan_round_sets_work_unit_fields(self) -> None:
 		"""WorkUnit fields are correctly populated from parsed data."""
 		planner = _planner()
@@ -196,7 +195,6 @@ class TestPlanRound:
 		assert wu.specialist == "test-writer"
 		assert wu.speculation_score == 0.3
 
-	@pytest.mark.asyncio
 	async def test_plan_round_resolves_file_overlaps(self) -> None:
 		"""File overlaps between units are resolved with dependency edges."""
 		planner = _planner()
@@ -218,8 +216,8 @@ class TestPlanRound:
 # -- _invoke_planner_llm tests --
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestInvokePlannerLlm:
-	@pytest.mark.asyncio
 	async def test_llm_failure_returns_fallback(self) -> None:
 		"""When subprocess fails, return a single fallback leaf."""
 		planner = _planner()
@@ -235,7 +233,6 @@ class TestInvokePlannerLlm:
 		assert len(result.units) == 1
 		assert result.units[0]["title"] == "Execute scope"
 
-	@pytest.mark.asyncio
 	async def test_llm_success_parses_output(self) -> None:
 		"""When subprocess succeeds, output is parsed via _parse_planner_output."""
 		planner = _planner()
@@ -254,7 +251,6 @@ class TestInvokePlannerLlm:
 		assert result.type == "leaves"
 		assert result.units[0]["title"] == "Parsed task"
 
-	@pytest.mark.asyncio
 	async def test_llm_timeout_returns_fallback_and_kills_process(self) -> None:
 		"""When subprocess times out, kill the process and return a fallback leaf."""
 		planner = _planner()
@@ -274,7 +270,6 @@ class TestInvokePlannerLlm:
 		assert mock_proc.kill.call_count == 1
 		assert mock_proc.wait.await_count == 1
 
-	@pytest.mark.asyncio
 	async def test_llm_uses_stdin_not_shell_interpolation(self) -> None:
 		"""Prompt with shell metacharacters is passed via stdin, not shell command."""
 		planner = _planner()
@@ -308,7 +303,7 @@ class TestInvokePlannerLlm:
 
 
 class TestPlannerRetry:
-	@pytest.mark.asyncio
+	@pytest.mark.asyncio(loop_scope="module")
 	async def test_retry_on_parse_fallback_succeeds(self) -> None:
 		"""When first call returns unparseable output, retry once and return valid result."""
 		planner = _planner()
@@ -336,7 +331,7 @@ class TestPlannerRetry:
 		assert result.units[0]["title"] == "Real task"
 		assert mock_exec.call_count == 2
 
-	@pytest.mark.asyncio
+	@pytest.mark.asyncio(loop_scope="module")
 	async def test_retry_on_parse_fallback_also_fails(self) -> None:
 		"""When both calls return unparseable output, return fallback after two attempts."""
 		planner = _planner()
@@ -360,7 +355,7 @@ class TestPlannerRetry:
 		assert result.units[0]["title"] == "Execute scope"
 		assert mock_exec.call_count == 2
 
-	@pytest.mark.asyncio
+	@pytest.mark.asyncio(loop_scope="module")
 	async def test_no_retry_on_subprocess_failure(self) -> None:
 		"""When subprocess fails (returncode != 0), no retry -- return fallback immediately."""
 		planner = _planner()
@@ -379,7 +374,7 @@ class TestPlannerRetry:
 		assert result.units[0]["title"] == "Execute scope"
 		assert mock_exec.call_count == 1
 
-	@pytest.mark.asyncio
+	@pytest.mark.asyncio(loop_scope="module")
 	async def test_no_retry_on_timeout(self) -> None:
 		"""When subprocess times out, no retry -- return fallback immediately."""
 		planner = _planner()
@@ -468,10 +463,10 @@ class TestParsePlannerOutputEdgeCases:
 # -- depends_on_indices resolution tests --
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestDependsOnIndicesResolution:
 	"""Tests for the depends_on_indices -> WorkUnit.depends_on resolution in plan_round."""
 
-	@pytest.mark.asyncio
 	async def test_out_of_range_index(self) -> None:
 		"""depends_on_indices=[99] with only 3 units -- out-of-range index silently skipped."""
 		planner = _planner()
@@ -490,7 +485,6 @@ class TestDependsOnIndicesResolution:
 		assert len(units) == 3
 		assert units[2].depends_on == ""
 
-	@pytest.mark.asyncio
 	async def test_self_reference_index(self) -> None:
 		"""depends_on_indices=[0] on unit index 0 -- self-reference should be skipped."""
 		planner = _planner()
@@ -507,7 +501,6 @@ class TestDependsOnIndicesResolution:
 
 		assert units[0].depends_on == ""
 
-	@pytest.mark.asyncio
 	async def test_non_integer_values(self) -> None:
 		"""depends_on_indices=["foo", None, 1.5] -- non-int values should be skipped."""
 		planner = _planner()
@@ -527,7 +520,6 @@ class TestDependsOnIndicesResolution:
 
 		assert units[1].depends_on == ""
 
-	@pytest.mark.asyncio
 	async def test_empty_depends_on_indices(self) -> None:
 		"""depends_on_indices=[] -- no depends_on should be set."""
 		planner = _planner()
@@ -545,7 +537,6 @@ class TestDependsOnIndicesResolution:
 		for wu in units:
 			assert wu.depends_on == ""
 
-	@pytest.mark.asyncio
 	async def test_valid_dependency_chain(self) -> None:
 		"""3 units: unit[1] depends on unit[0], unit[2] depends on unit[0] and unit[1]."""
 		planner = _planner()
@@ -565,7 +556,6 @@ class TestDependsOnIndicesResolution:
 		assert units[1].depends_on == units[0].id
 		assert units[2].depends_on == f"{units[0].id},{units[1].id}"
 
-	@pytest.mark.asyncio
 	async def test_mixed_valid_and_invalid_indices(self) -> None:
 		"""depends_on_indices=[0, 99, -1, 1] -- only valid in-range, non-self indices kept."""
 		planner = _planner()
@@ -591,10 +581,10 @@ class TestDependsOnIndicesResolution:
 # -- Subprocess cwd assertion tests --
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestSubprocessCwdAssertion:
 	"""Verify that _run_planner_subprocess always uses config.target.resolved_path as cwd."""
 
-	@pytest.mark.asyncio
 	async def test_subprocess_cwd_matches_target_resolved_path(self) -> None:
 		"""The cwd passed to create_subprocess_exec must equal config.target.resolved_path."""
 		planner = _planner()
@@ -617,7 +607,6 @@ class TestSubprocessCwdAssertion:
 		expected_cwd = str(planner.config.target.resolved_path)
 		assert call_kwargs["cwd"] == expected_cwd
 
-	@pytest.mark.asyncio
 	async def test_subprocess_cwd_rejects_relative_path(self) -> None:
 		"""If config.target.resolved_path is somehow relative, the assertion fires."""
 		planner = _planner()
@@ -857,7 +846,7 @@ class TestCausalContextAndSnapshot:
 		planner.set_project_snapshot("src/ has 20 files")
 		assert planner._project_snapshot == "src/ has 20 files"
 
-	@pytest.mark.asyncio
+	@pytest.mark.asyncio(loop_scope="module")
 	async def test_causal_risks_included_in_prompt(self) -> None:
 		"""When _causal_risks is set, the prompt includes it."""
 		planner = _planner()
@@ -877,7 +866,7 @@ class TestCausalContextAndSnapshot:
 		prompt = mock_proc.communicate.call_args[1]["input"].decode()
 		assert "model=opus: 9% failure" in prompt
 
-	@pytest.mark.asyncio
+	@pytest.mark.asyncio(loop_scope="module")
 	async def test_project_snapshot_included_in_prompt(self) -> None:
 		"""When _project_snapshot is set, the prompt includes it."""
 		planner = _planner()
@@ -899,7 +888,7 @@ class TestCausalContextAndSnapshot:
 		assert "## Project Structure" in prompt
 
 
-	@pytest.mark.asyncio
+	@pytest.mark.asyncio(loop_scope="module")
 	async def test_ambitious_prompt_with_web_search(self) -> None:
 		"""Planner prompt includes ambitious framing and WebSearch instruction."""
 		planner = _planner()
@@ -923,7 +912,7 @@ class TestCausalContextAndSnapshot:
 		assert "WebFetch" in prompt
 		assert "Think ambitiously" in prompt
 
-	@pytest.mark.asyncio
+	@pytest.mark.asyncio(loop_scope="module")
 	async def test_allowed_tools_passed_to_subprocess(self) -> None:
 		"""Planner subprocess command includes --allowedTools flags."""
 		planner = _planner()
@@ -953,10 +942,10 @@ class TestCausalContextAndSnapshot:
 # -- Per-component model usage tests --
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestPerComponentModelUsage:
 	"""Tests for config.models.planner_model usage in _run_planner_subprocess."""
 
-	@pytest.mark.asyncio
 	async def test_uses_scheduler_model_when_no_models_config(self) -> None:
 		"""Without config.models.planner_model, falls back to scheduler.model."""
 		planner = _planner()
@@ -980,7 +969,6 @@ class TestPerComponentModelUsage:
 		model_idx = list(call_args).index("--model")
 		assert call_args[model_idx + 1] == "sonnet"
 
-	@pytest.mark.asyncio
 	async def test_uses_planner_model_from_models_config(self) -> None:
 		"""When config.models.planner_model is set, it overrides scheduler.model."""
 		planner = _planner()
@@ -1007,7 +995,6 @@ class TestPerComponentModelUsage:
 		model_idx = list(call_args).index("--model")
 		assert call_args[model_idx + 1] == "haiku"
 
-	@pytest.mark.asyncio
 	async def test_falls_back_when_planner_model_is_none(self) -> None:
 		"""When config.models exists but planner_model is None, falls back to scheduler.model."""
 		planner = _planner()
@@ -1034,7 +1021,6 @@ class TestPerComponentModelUsage:
 		model_idx = list(call_args).index("--model")
 		assert call_args[model_idx + 1] == "sonnet"
 
-	@pytest.mark.asyncio
 	async def test_falls_back_when_planner_model_is_empty(self) -> None:
 		"""When config.models.planner_model is empty string, falls back to scheduler.model."""
 		planner = _planner()
@@ -1167,56 +1153,79 @@ class TestOverlapWithLayers:
 
 
 def _continuous_config() -> MissionConfig:
-	mc = MissionConfig()
-	mc.target = TargetConfig(name="test", path="/tmp/test", objective="Build API")
-	mc.planner = PlannerConfig()
-	mc.continuous = ContinuousConfig()
-	return mc
+	return MissionConfig(target=TargetConfig(name="test", path="/tmp/test", objective="Build API"))
 
 
 def _mission() -> Mission:
 	return Mission(id="m1", objective="Build a production API")
 
 
+# Prototypes are copied with dataclasses.replace so per-test mocks skip the
+# id/timestamp default factories.
+_PLAN = Plan(id="p1", objective="test")
+_UNIT = WorkUnit(id="wu1", title="Task 1")
+
+
+def _plan(**overrides: Any) -> Plan:
+	return replace(_PLAN, **overrides)
+
+
+def _unit(**overrides: Any) -> WorkUnit:
+	return replace(_UNIT, **overrides)
+
+
+class _StubPlanRound:
+	"""Minimal async stand-in for RecursivePlanner.plan_round that records call kwargs."""
+
+	def __init__(
+		self,
+		result: tuple[Plan, list[WorkUnit], float] | None = None,
+		side_effect: Callable[..., Awaitable[tuple[Plan, list[WorkUnit], float]]] | None = None,
+	) -> None:
+		self.calls: list[dict[str, Any]] = []
+		self._result = result
+		self._side_effect = side_effect
+
+	async def __call__(self, **kwargs: Any) -> tuple[Plan, list[WorkUnit], float]:
+		self.calls.append(kwargs)
+		if self._side_effect is not None:
+			return await self._side_effect(**kwargs)
+		assert self._result is not None
+		return self._result
+
+
 # -- ContinuousPlanner tests --
 
 
-class TestCausalContextAndSnapshotDelegation:
-	def test_set_causal_context_delegates(self) -> None:
-		"""set_causal_context delegates to inner planner."""
-		config = _continuous_config()
-		db = Database(":memory:")
-		planner = ContinuousPlanner(config, db)
-		planner.set_causal_context("model=opus: 9% failure")
-		assert planner._inner._causal_risks == "model=opus: 9% failure"
+@pytest.fixture()
+def continuous_planner(db: Database) -> ContinuousPlanner:
+	return ContinuousPlanner(_continuous_config(), db)
 
-	def test_set_project_snapshot_delegates(self) -> None:
-		"""set_project_snapshot delegates to inner planner."""
-		config = _continuous_config()
-		db = Database(":memory:")
-		planner = ContinuousPlanner(config, db)
-		planner.set_project_snapshot("src/ has 20 files")
-		assert planner._inner._project_snapshot == "src/ has 20 files"
 
-	def test_set_strategy(self) -> None:
+class TestCausalContextAndSnapshotDelegation:
+	def test_setters_delegate_to_inner_planner(self, continuous_planner: ContinuousPlanner) -> None:
+		"""set_causal_context and set_project_snapshot delegate to the inner planner."""
+		continuous_planner.set_causal_context("model=opus: 9% failure")
+		continuous_planner.set_project_snapshot("src/ has 20 files")
+		assert continuous_planner._inner._causal_risks == "model=opus: 9% failure"
+		assert continuous_planner._inner._project_snapshot == "src/ has 20 files"
+
+	def test_set_strategy(self, continuous_planner: ContinuousPlanner) -> None:
 		"""set_strategy stores the research phase strategy."""
-		config = _continuous_config()
-		db = Database(":memory:")
-		planner = ContinuousPlanner(config, db)
-		planner.set_strategy("Use JWT auth with refresh tokens")
-		assert planner._strategy == "Use JWT auth with refresh tokens"
+		continuous_planner.set_strategy("Use JWT auth with refresh tokens")
+		assert continuous_planner._strategy == "Use JWT auth with refresh tokens"
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestGetNextUnits:
-	async def test_invokes_planner_every_time(self) -> None:
+	async def test_invokes_planner_every_time(self, continuous_planner: ContinuousPlanner) -> None:
 		"""Every call invokes the LLM (no backlog)."""
-		config = _continuous_config()
-		db = Database(":memory:")
-		planner = ContinuousPlanner(config, db)
+		planner = continuous_planner
 
-		mock_wu = WorkUnit(id="wu1", plan_id="p1", title="Task 1")
-		mock_plan = Plan(id="p1", objective="test")
-		planner._inner.plan_round = AsyncMock(return_value=(mock_plan, [mock_wu], 0.10))
+		mock_wu = _unit(plan_id="p1")
+		mock_plan = _plan()
+		stub = _StubPlanRound((mock_plan, [mock_wu], 0.10))
+		planner._inner.plan_round = stub  # type: ignore[method-assign, assignment]
 
 		mission = _mission()
 		plan, units, epoch = await planner.get_next_units(mission, max_units=3)
@@ -1224,24 +1233,22 @@ class TestGetNextUnits:
 		assert len(units) == 1
 		assert units[0].title == "Task 1"
 		assert epoch.number == 1
-		planner._inner.plan_round.assert_called_once()
+		assert len(stub.calls) == 1
 
-	async def test_epoch_increments(self) -> None:
+	async def test_epoch_increments(self, continuous_planner: ContinuousPlanner) -> None:
 		"""Each call creates a new epoch."""
-		config = _continuous_config()
-		db = Database(":memory:")
-		planner = ContinuousPlanner(config, db)
+		planner = continuous_planner
 
 		call_count = 0
 
-		async def mock_plan_round(**kwargs):
+		async def mock_plan_round(**kwargs: Any) -> tuple[Plan, list[WorkUnit], float]:
 			nonlocal call_count
 			call_count += 1
-			plan = Plan(id=f"p{call_count}", objective="test")
-			wu = WorkUnit(id=f"wu{call_count}", title=f"Task {call_count}")
+			plan = _plan(id=f"p{call_count}")
+			wu = _unit(id=f"wu{call_count}", title=f"Task {call_count}")
 			return plan, [wu], 0.10
 
-		planner._inner.plan_round = AsyncMock(side_effect=mock_plan_round)
+		planner._inner.plan_round = _StubPlanRound(side_effect=mock_plan_round)  # type: ignore[method-assign, assignment]
 		mission = _mission()
 
 		_, _, epoch1 = await planner.get_next_units(mission)
@@ -1249,42 +1256,37 @@ class TestGetNextUnits:
 		_, _, epoch2 = await planner.get_next_units(mission)
 		assert epoch2.number == 2
 
-	async def test_empty_plan_returns_empty(self) -> None:
+	async def test_empty_plan_returns_empty(self, continuous_planner: ContinuousPlanner) -> None:
 		"""Empty plan from LLM returns empty units."""
-		config = _continuous_config()
-		db = Database(":memory:")
-		planner = ContinuousPlanner(config, db)
+		planner = continuous_planner
 
-		mock_plan = Plan(id="p1", objective="test")
-		planner._inner.plan_round = AsyncMock(return_value=(mock_plan, [], 0.0))
+		mock_plan = _plan()
+		planner._inner.plan_round = _StubPlanRound((mock_plan, [], 0.0))  # type: ignore[method-assign, assignment]
 
 		mission = _mission()
 		plan, units, epoch = await planner.get_next_units(mission, max_units=3)
 		assert len(units) == 0
 
-	async def test_limits_to_max_units(self) -> None:
+	async def test_limits_to_max_units(self, continuous_planner: ContinuousPlanner) -> None:
 		"""Only returns max_units even if planner generates more."""
-		config = _continuous_config()
-		db = Database(":memory:")
-		planner = ContinuousPlanner(config, db)
+		planner = continuous_planner
 
-		mock_units = [WorkUnit(id=f"wu{i}", title=f"Task {i}") for i in range(5)]
-		mock_plan = Plan(id="p1", objective="test")
-		planner._inner.plan_round = AsyncMock(return_value=(mock_plan, mock_units, 0.10))
+		mock_units = [_unit(id=f"wu{i}", title=f"Task {i}") for i in range(5)]
+		mock_plan = _plan()
+		planner._inner.plan_round = _StubPlanRound((mock_plan, mock_units, 0.10))  # type: ignore[method-assign, assignment]
 
 		mission = _mission()
 		plan, units, epoch = await planner.get_next_units(mission, max_units=2)
 		assert len(units) == 2
 
-	async def test_knowledge_context_passed_to_planner(self) -> None:
+	async def test_knowledge_context_passed_to_planner(self, continuous_planner: ContinuousPlanner) -> None:
 		"""Knowledge context is included in the feedback."""
-		config = _continuous_config()
-		db = Database(":memory:")
-		planner = ContinuousPlanner(config, db)
+		planner = continuous_planner
 
-		mock_plan = Plan(id="p1", objective="test")
-		wu = WorkUnit(id="wu1", title="Task")
-		planner._inner.plan_round = AsyncMock(return_value=(mock_plan, [wu], 0.10))
+		mock_plan = _plan()
+		wu = _unit(title="Task")
+		stub = _StubPlanRound((mock_plan, [wu], 0.10))
+		planner._inner.plan_round = stub  # type: ignore[method-assign, assignment]
 
 		mission = _mission()
 		await planner.get_next_units(
@@ -1292,7 +1294,7 @@ class TestGetNextUnits:
 			knowledge_context="JWT auth is used, No refresh tokens",
 		)
 
-		call_kwargs = planner._inner.plan_round.call_args[1]
+		call_kwargs = stub.calls[-1]
 		feedback = call_kwargs.get("feedback_context", "")
 		assert "JWT auth is used" in feedback
 		assert "Accumulated Knowledge" in feedback
@@ -1313,9 +1315,9 @@ class TestBuildPlannerContext:
 		db.insert_epoch(epoch)
 		plan = Plan(id="p1", objective="test")
 		db.insert_plan(plan)
-		unit = WorkUnit(id="wu1", plan_id="p1", title="Task")
+		unit = _unit(plan_id="p1", title="Task")
 		db.insert_work_unit(unit)
-		handoff = Handoff(
+		handoff = Handoff.model_construct(
 			id="h1", work_unit_id="wu1", round_id="", epoch_id="ep1",
 			status="failed", summary="Broke",
 			concerns=["Something went wrong"],
@@ -1332,9 +1334,9 @@ class TestBuildPlannerContext:
 		db.insert_epoch(epoch)
 		plan = Plan(id="p1", objective="test")
 		db.insert_plan(plan)
-		unit = WorkUnit(id="wu1", plan_id="p1", title="Task")
+		unit = _unit(plan_id="p1", title="Task")
 		db.insert_work_unit(unit)
-		handoff = Handoff(
+		handoff = Handoff.model_construct(
 			id="h1", work_unit_id="wu1", round_id="", epoch_id="ep1",
 			status="completed", summary="Did the thing",
 		)
@@ -1380,11 +1382,11 @@ class TestUpdateMissionState:
 		db.insert_epoch(epoch)
 		plan = Plan(id="p1", objective="test")
 		db.insert_plan(plan)
-		wu1 = WorkUnit(
-			id="wu1", plan_id="p1", title="Task 1",
+		wu1 = _unit(
+			plan_id="p1", title="Task 1",
 			status="completed", finished_at="2025-01-01T12:00:00", epoch_id="ep1",
 		)
-		wu2 = WorkUnit(id="wu2", plan_id="p1", title="Task 2", status="failed", epoch_id="ep1")
+		wu2 = _unit(id="wu2", plan_id="p1", title="Task 2", status="failed", epoch_id="ep1")
 		db.insert_work_unit(wu1)
 		db.insert_work_unit(wu2)
 
@@ -1402,9 +1404,9 @@ class TestUpdateMissionState:
 		db.insert_epoch(epoch)
 		plan = Plan(id="p1", objective="test")
 		db.insert_plan(plan)
-		unit = WorkUnit(id="wu1", plan_id="p1", title="Task")
+		unit = _unit(plan_id="p1", title="Task")
 		db.insert_work_unit(unit)
-		handoff = Handoff(
+		handoff = Handoff.model_construct(
 			id="h1", work_unit_id="wu1", round_id="", epoch_id="ep1",
 			status="failed", summary="Broke",
 			concerns=["Something went wrong"],
@@ -1436,9 +1438,9 @@ class TestUpdateMissionState:
 		db.insert_epoch(epoch)
 		plan = Plan(id="p1", objective="test")
 		db.insert_plan(plan)
-		unit = WorkUnit(id="wu1", plan_id="p1", title="Task")
+		unit = _unit(plan_id="p1", title="Task")
 		db.insert_work_unit(unit)
-		handoff = Handoff(
+		handoff = Handoff.model_construct(
 			id="h1", work_unit_id="wu1", round_id="", epoch_id="ep1",
 			status="completed", summary="Done",
 			files_changed=["src/a.py", "src/b.py"],
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -99,11 +99,6 @@ def test_prompt_evolution_absent_in_toml(tmp_path: Path) -> None:
 
 # -- DB CRUD tests --
 
-@pytest.fixture()
-def db() -> Database:
-	return Database(":memory:")
-
-
 def test_insert_and_get_variant(db: Database) -> None:
 	v = PromptVariant(
 		id="pv1", component="worker", variant_id="worker-v1",
@@ -136,31 +131,35 @@ def test_update_variant(db: Database) -> None:
 
 
 def test_get_variants_for_component_ordered(db: Database) -> None:
-	db.insert_prompt_variant(PromptVariant(
-		id="pv1", component="worker", variant_id="w-low",
-		content="low", win_rate=0.3, sample_count=10,
-	))
-	db.insert_prompt_variant(PromptVariant(
-		id="pv2", component="worker", variant_id="w-high",
-		content="high", win_rate=0.9, sample_count=10,
-	))
-	db.insert_prompt_variant(PromptVariant(
-		id="pv3", component="planner", variant_id="p-mid",
-		content="mid", win_rate=0.6,
-	))
+	db.insert_prompt_variants([
+		PromptVariant(id="pv1", component="worker", variant_id="w-low", content="low", win_rate=0.3, sample_count=10),
+		PromptVariant(id="pv2", component="worker", variant_id="w-high", content="high", win_rate=0.9, sample_count=10),
+		PromptVariant(id="pv3", component="planner", variant_id="p-mid", content="mid", win_rate=0.6),
+	])
 	variants = db.get_prompt_variants_for_component("worker")
 	assert len(variants) == 2
 	assert variants[0].variant_id == "w-high"
 	assert variants[1].variant_id == "w-low"
 
 
+def test_insert_variants_is_atomic(db: Database) -> None:
+	with pytest.raises(sqlite3.IntegrityError):
+		db.insert_prompt_variants([
+			PromptVariant(id="pv1", component="worker", variant_id="w-a", content="a"),
+			PromptVariant(id="pv1", component="worker", variant_id="w-b", content="b"),
+		])
+	assert db.get_prompt_variants_for_component("worker") == []
+
+
 def test_insert_and_count_outcomes(db: Database) -> None:
 	db.insert_prompt_variant(PromptVariant(
 		id="pv1", component="worker", variant_id="w-v1", content="test",
 	))
-	db.insert_prompt_outcome(PromptOutcome(id="o1", variant_id="w-v1", outcome="pass"))
-	db.insert_prompt_outcome(PromptOutcome(id="o2", variant_id="w-v1", outcome="pass"))
-	db.insert_prompt_outcome(PromptOutcome(id="o3", variant_id="w-v1", outcome="fail"))
+	db.insert_prompt_outcomes([
+		PromptOutcome(id="o1", variant_id="w-v1", outcome="pass"),
+		PromptOutcome(id="o2", variant_id="w-v1", outcome="pass"),
+		PromptOutcome(id="o3", variant_id="w-v1", outcome="fail"),
+	])
 	counts = db.count_prompt_outcomes("w-v1")
 	assert counts["pass"] == 2
 	assert counts["fail"] == 1
@@ -170,8 +169,10 @@ def test_get_outcomes_for_variant(db: Database) -> None:
 	db.insert_prompt_variant(PromptVariant(
 		id="pv1", component="worker", variant_id="w-v1", content="test",
 	))
-	db.insert_prompt_outcome(PromptOutcome(id="o1", variant_id="w-v1", outcome="pass"))
-	db.insert_prompt_outcome(PromptOutcome(id="o2", variant_id="w-v1", outcome="fail"))
+	db.insert_prompt_outcomes([
+		PromptOutcome(id="o1", variant_id="w-v1", outcome="pass"),
+		PromptOutcome(id="o2", variant_id="w-v1", outcome="fail"),
+	])
 	outcomes = db.get_prompt_outcomes_for_variant("w-v1")
 	assert len(outcomes) == 2
 
@@ -184,58 +185,32 @@ def engine(db: Database) -> PromptEvolutionEngine:
 	return PromptEvolutionEngine(db, config)
 
 
-def test_select_variant_empty(engine: PromptEvolutionEngine) -> None:
-	assert engine.select_variant("worker") is None
-
-
-def test_select_variant_unseen_first(engine: PromptEvolutionEngine, db: Database) -> None:
-	db.insert_prompt_variant(PromptVariant(
-		id="pv1", component="worker", variant_id="w-tested",
-		content="tested", win_rate=0.9, sample_count=10,
-	))
-	db.insert_prompt_variant(PromptVariant(
-		id="pv2", component="worker", variant_id="w-unseen",
-		content="unseen", win_rate=0.0, sample_count=0,
-	))
-	selected = engine.select_variant("worker")
-	assert selected is not None
-	assert selected.variant_id == "w-unseen"
-
-
-def test_select_variant_ucb1_math(engine: PromptEvolutionEngine, db: Database) -> None:
-	"""With C=1.4, verify UCB1 selects correctly."""
-	db.insert_prompt_variant(PromptVariant(
-		id="pv1", component="worker", variant_id="w-a",
-		content="a", win_rate=0.8, sample_count=20,
-	))
-	db.insert_prompt_variant(PromptVariant(
-		id="pv2", component="worker", variant_id="w-b",
-		content="b", win_rate=0.5, sample_count=5,
-	))
-	# UCB1 scores: N=25, C=1.4
-	# A: 0.8 + 1.4 * sqrt(ln(25)/20) = 0.8 + 1.4 * sqrt(3.219/20) = 0.8 + 0.562
-	# B: 0.5 + 1.4 * sqrt(ln(25)/5) = 0.5 + 1.4 * sqrt(3.219/5) = 0.5 + 1.124
-	# B should win
-	selected = engine.select_variant("worker")
-	assert selected is not None
-	assert selected.variant_id == "w-b"
-
-
-def test_select_variant_pure_exploitation(db: Database) -> None:
-	"""With C=0, should always select highest win_rate."""
-	config = PromptEvolutionConfig(enabled=True, exploration_factor=0.0)
-	engine = PromptEvolutionEngine(db, config)
-	db.insert_prompt_variant(PromptVariant(
-		id="pv1", component="worker", variant_id="w-best",
-		content="best", win_rate=0.9, sample_count=10,
-	))
-	db.insert_prompt_variant(PromptVariant(
-		id="pv2", component="worker", variant_id="w-worse",
-		content="worse", win_rate=0.3, sample_count=10,
-	))
+@pytest.mark.parametrize(("variants", "exploration_factor", "expected"), [
+	([], 1.4, None),
+	([("w-tested", 0.9, 10), ("w-unseen", 0.0, 0)], 1.4, "w-unseen"),
+	# UCB1 with N=25, C=1.4:
+	# A: 0.8 + 1.4 * sqrt(ln(25)/20) = 0.8 + 0.562
+	# B: 0.5 + 1.4 * sqrt(ln(25)/5) = 0.5 + 1.124
+	([("w-a", 0.8, 20), ("w-b", 0.5, 5)], 1.4, "w-b"),
+	# C=0 is pure exploitation: highest win_rate wins
+	([("w-best", 0.9, 10), ("w-worse", 0.3, 10)], 0.0, "w-best"),
+], ids=["empty", "unseen-first", "ucb1-math", "pure-exploitation"])
+def test_select_variant(
+	db: Database,
+	variants: list[tuple[str, float, int]],
+	exploration_factor: float,
+	expected: str | None,
+) -> None:
+	db.insert_prompt_variants([
+		PromptVariant(
+			id=f"pv{i}", component="worker", variant_id=variant_id,
+			content=variant_id, win_rate=win_rate, sample_count=sample_count,
+		)
+		for i, (variant_id, win_rate, sample_count) in enumerate(variants)
+	])
+	engine = PromptEvolutionEngine(db, PromptEvolutionConfig(enabled=True, exploration_factor=exploration_factor))
 	selected = engine.select_variant("worker")
-	assert selected is not None
-	assert selected.variant_id == "w-best"
+	assert (selected.variant_id if selected else None) == expected
 
 
 def test_record_outcome_updates_win_rate(engine: PromptEvolutionEngine, db: Database) -> None:
@@ -270,6 +245,16 @@ async def test_propose_mutation_skips_below_min_samples(
 	assert result is None
 
 
+class _FakeProc:
+	returncode = 0
+
+	def __init__(self, stdout: bytes) -> None:
+		self._stdout = stdout
+
+	async def communicate(self, input: bytes | None = None) -> tuple[bytes, bytes]:
+		return self._stdout, b""
+
+
 @pytest.mark.asyncio()
 async def test_propose_mutation_success(
 	engine: PromptEvolutionEngine, db: Database,
@@ -279,12 +264,11 @@ async def test_propose_mutation_success(
 		content="original prompt", win_rate=0.6, sample_count=10,
 	))
 
-	mock_proc = AsyncMock()
-	mock_proc.communicate = AsyncMock(return_value=(b"improved prompt content", b""))
-	mock_proc.returncode = 0
+	async def runner(*args: object, **kwargs: object) -> _FakeProc:
+		return _FakeProc(b"improved prompt content")
 
-	with patch("asyncio.create_subprocess_exec", return_value=mock_proc):
-		result = await engine.propose_mutation("worker", ["failure trace 1", "failure trace 2"])
+	engine = PromptEvolutionEngine(db, engine.config, subprocess_runner=runner)
+	result = await engine.propose_mutation("worker", ["failure trace 1", "failure trace 2"])
 
 	assert result is not None
 	assert result.content == "improved prompt content"
@@ -310,6 +294,9 @@ async def test_propose_mutation_llm_failure(
 		content="original", win_rate=0.6, sample_count=10,
 	))
 
-	with patch("asyncio.create_subprocess_exec", side_effect=OSError("no claude")):
-		result = await engine.propose_mutation("worker", ["trace"])
+	async def runner(*args: object, **kwargs: object) -> _FakeProc:
+		raise OSError("no claude")
+
+	engine = PromptEvolutionEngine(db, engine.config, subprocess_runner=runner)
+	result = await engine.propose_mutation("worker", ["trace"])
 	assert result is None
@@ -587,6 +587,14 @@ class TestParseMcResultStreamJson:
 		result = parse_mc_result(output)
 		assert result is None
 
+	def test_stream_json_without_marker_skips_event_scan(self, monkeypatch: pytest.MonkeyPatch) -> None:
+		"""Output with no AD_RESULT marker anywhere is rejected before NDJSON decoding."""
+		def _fail(output: str) -> str:
+			raise AssertionError("stream-json scan should be skipped")
+		monkeypatch.setattr("autodev.session.extract_text_from_stream_json", _fail)
+		output = json.dumps({"type": "result", "result": "all done, no structured result"}) + "\n"
+		assert parse_mc_result(output) is None
+
 	def test_stream_json_with_trace_prefixes(self) -> None:
 		"""Stream-json output with [OUT] trace prefixes is handled."""
 		ad_json = '{"status":"blocked","commits":[],"summary":"stuck","files_changed":[],"concerns":["blocked"]}'
@@ -16,11 +16,6 @@ from autodev.intelligence.spec_generator import SpecGenerator, _strip_html
 # -- Fixtures --
 
 
-@pytest.fixture
-def db() -> Database:
-	return Database(":memory:")
-
-
 @pytest.fixture
 def config() -> MissionConfig:
 	cfg = MissionConfig()
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from autodev.config import MissionConfig, SpeculationConfig, _build_speculation, load_config
-from autodev.continuous_controller import ContinuousController, DynamicSemaphore, WorkerCompletion
+from autodev.continuous_controller import ContinuousController, WorkerCompletion
 from autodev.db import Database
+from autodev.green_branch import UnitMergeResult
 from autodev.models import (
 	Epoch,
 	Mission,
@@ -20,14 +24,7 @@ from autodev.models import (
 	WorkUnit,
 )
 
-# -- Fixtures --
-
-
-@pytest.fixture
-def db(tmp_path: Path) -> Database:
-	d = Database(tmp_path / "test.db")
-	yield d
-	d.close()
+# -- Helpers --
 
 
 def _create_mission_and_plan(db: Database, mission_id: str = "m-1", plan_id: str = "p-1") -> tuple[Mission, Plan]:
@@ -38,17 +35,31 @@ def _create_mission_and_plan(db: Database, mission_id: str = "m-1", plan_id: str
 	return mission, plan
 
 
+_PARENT = WorkUnit(id="parent-1", plan_id="p-1", unit_type="speculation_parent")
+_BRANCH = WorkUnit(id="b-1", plan_id="p-1", status="completed", unit_type="speculation_branch")
+
+
+def _parent(**overrides: Any) -> WorkUnit:
+	return replace(_PARENT, **overrides)
+
+
+def _branch(**overrides: Any) -> WorkUnit:
+	return replace(_BRANCH, **overrides)
+
+
 # -- Config tests --
 
 
 class TestSpeculationConfigDefaults:
-	def test_defaults(self) -> None:
-		sc = SpeculationConfig()
-		assert sc.enabled is False
-		assert sc.uncertainty_threshold == 0.7
-		assert sc.branch_count == 2
-		assert sc.selection_metric == "review_score"
-		assert sc.cost_limit_multiplier == 1.5
+	@pytest.mark.parametrize("attr,expected", [
+		("enabled", False),
+		("uncertainty_threshold", 0.7),
+		("branch_count", 2),
+		("selection_metric", "review_score"),
+		("cost_limit_multiplier", 1.5),
+	])
+	def test_default(self, attr: str, expected: object) -> None:
+		assert getattr(SpeculationConfig(), attr) == expected
 
 	def test_build_speculation(self) -> None:
 		data = {
@@ -110,18 +121,22 @@ class TestWorkUnitSpeculationFields:
 
 
 class TestSpeculationResultDefaults:
-	def test_defaults(self) -> None:
-		sr = SpeculationResult()
-		assert sr.parent_unit_id == ""
-		assert sr.winner_branch_id == ""
-		assert sr.mission_id == ""
-		assert sr.epoch_id == ""
-		assert sr.branch_count == 0
-		assert sr.branch_ids == ""
-		assert sr.branch_scores == ""
-		assert sr.total_speculation_cost_usd == 0.0
-		assert sr.selection_metric == "review_score"
-		assert sr.timestamp != ""  # auto-generated
+	@pytest.mark.parametrize("attr,expected", [
+		("parent_unit_id", ""),
+		("winner_branch_id", ""),
+		("mission_id", ""),
+		("epoch_id", ""),
+		("branch_count", 0),
+		("branch_ids", ""),
+		("branch_scores", ""),
+		("total_speculation_cost_usd", 0.0),
+		("selection_metric", "review_score"),
+	])
+	def test_default(self, attr: str, expected: object) -> None:
+		assert getattr(SpeculationResult(), attr) == expected
+
+	def test_timestamp_auto_generated(self) -> None:
+		assert SpeculationResult().timestamp != ""
 
 
 # -- DB tests --
@@ -159,11 +174,29 @@ class TestSpeculationResultDB:
 	def test_results_for_different_mission(self, db: Database) -> None:
 		_create_mission_and_plan(db, "m-1", "p-1")
 		_create_mission_and_plan(db, "m-2", "p-2")
-		db.insert_speculation_result(SpeculationResult(id="sr-1", mission_id="m-1", parent_unit_id="wu-1"))
-		db.insert_speculation_result(SpeculationResult(id="sr-2", mission_id="m-2", parent_unit_id="wu-2"))
+		db.insert_speculation_results([
+			SpeculationResult(id="sr-1", mission_id="m-1", parent_unit_id="wu-1"),
+			SpeculationResult(id="sr-2", mission_id="m-2", parent_unit_id="wu-2"),
+		])
 		assert len(db.get_speculation_results_for_mission("m-1")) == 1
 		assert len(db.get_speculation_results_for_mission("m-2")) == 1
 
+	def test_mission_lookup_uses_index(self, db: Database) -> None:
+		plan = db.conn.execute(
+			"EXPLAIN QUERY PLAN SELECT * FROM speculation_results WHERE mission_id=? ORDER BY timestamp DESC",
+			("m-1",),
+		).fetchall()
+		assert "idx_speculation_results_mission" in plan[0]["detail"]
+
+	def test_insert_results_is_atomic(self, db: Database) -> None:
+		_create_mission_and_plan(db)
+		with pytest.raises(sqlite3.IntegrityError):
+			db.insert_speculation_results([
+				SpeculationResult(id="sr-1", mission_id="m-1", parent_unit_id="wu-1"),
+				SpeculationResult(id="sr-1", mission_id="m-1", parent_unit_id="wu-2"),
+			])
+		assert db.get_speculation_results_for_mission("m-1") == []
+
 	def test_speculation_score_persisted(self, db: Database) -> None:
 		_create_mission_and_plan(db)
 		wu = WorkUnit(id="wu-spec", plan_id="p-1", title="speculative", speculation_score=0.85)
@@ -213,34 +246,38 @@ def _make_config(**kwargs: object) -> MissionConfig:
 	return mc
 
 
-class TestSpeculationBelowThreshold:
-	def test_not_triggered(self) -> None:
-		"""Units below threshold should not trigger speculation dispatch."""
-		config = _make_config()
-		unit = WorkUnit(speculation_score=0.5)
-		# The check in _dispatch_loop: score >= threshold
-		assert not (
-			config.speculation.enabled
-			and unit.speculation_score >= config.speculation.uncertainty_threshold
-		)
+_MERGE_RESULT = UnitMergeResult(merged=True, merge_commit_hash="abc123")
 
-	def test_at_threshold_triggers(self) -> None:
-		"""Units at exactly the threshold should trigger."""
-		config = _make_config()
-		unit = WorkUnit(speculation_score=0.7)
-		assert (
-			config.speculation.enabled
-			and unit.speculation_score >= config.speculation.uncertainty_threshold
-		)
 
-	def test_disabled_does_not_trigger(self) -> None:
-		"""Even high-score units don't trigger when disabled."""
-		config = _make_config(**{"speculation.enabled": False})
-		unit = WorkUnit(speculation_score=0.9)
-		assert not (
-			config.speculation.enabled
-			and unit.speculation_score >= config.speculation.uncertainty_threshold
-		)
+def _make_controller(
+	db: Database, config: MissionConfig | None = None,
+) -> tuple[ContinuousController, AsyncMock, AsyncMock]:
+	"""Controller with mocked backend, planner and a green branch whose merges succeed.
+
+	Returns the controller with its backend and green-branch mocks.
+	"""
+	controller = ContinuousController(config or _make_config(), db)
+	backend = AsyncMock()
+	green_branch = AsyncMock()
+	green_branch.merge_unit = AsyncMock(return_value=_MERGE_RESULT)
+	controller._backend = backend
+	controller._green_branch = green_branch
+	controller._planner = MagicMock()
+	return controller, backend, green_branch
+
+
+class TestSpeculationBelowThreshold:
+	@pytest.mark.parametrize("enabled,score,expected", [
+		pytest.param(True, 0.5, False, id="below-threshold"),
+		pytest.param(True, 0.7, True, id="at-threshold"),
+		pytest.param(False, 0.9, False, id="disabled"),
+	])
+	def test_trigger(self, enabled: bool, score: float, expected: bool) -> None:
+		"""Speculation triggers only when enabled and score >= threshold (the _dispatch_loop check)."""
+		config = _make_config(**{"speculation.enabled": enabled})
+		unit = WorkUnit(speculation_score=score)
+		triggered = config.speculation.enabled and unit.speculation_score >= config.speculation.uncertainty_threshold
+		assert triggered is expected
 
 
 class TestApproachHints:
@@ -274,34 +311,19 @@ class TestSpeculationWinnerByReviewScore:
 	@pytest.mark.asyncio
 	async def test_highest_score_wins(self, db: Database) -> None:
 		"""The branch with the highest review score should be selected as winner."""
-		config = _make_config()
-		controller = ContinuousController(config, db)
-		controller._backend = AsyncMock()
-		controller._green_branch = AsyncMock()
-		controller._green_branch.merge_unit = AsyncMock(
-			return_value=MagicMock(merged=True, merge_commit_hash="abc123"),
-		)
-		controller._planner = MagicMock()
+		controller, backend, green_branch = _make_controller(db)
 		controller._diff_reviewer = AsyncMock()
 
 		mission = Mission(id="m-1", objective="test")
 		epoch = Epoch(id="e-1", mission_id="m-1")
 
 		# Create parent unit
-		parent = WorkUnit(id="parent-1", plan_id="p-1", unit_type="speculation_parent")
+		parent = _parent(id="parent-1")
 		controller._speculation_parent_units["parent-1"] = parent
 
 		# Create 2 branch completions with different scores
-		branch1 = WorkUnit(
-			id="b-1", plan_id="p-1", status="completed",
-			commit_hash="hash1", cost_usd=0.5, unit_type="speculation_branch",
-			speculation_parent_id="parent-1",
-		)
-		branch2 = WorkUnit(
-			id="b-2", plan_id="p-1", status="completed",
-			commit_hash="hash2", cost_usd=0.3, unit_type="speculation_branch",
-			speculation_parent_id="parent-1",
-		)
+		branch1 = _branch(id="b-1", commit_hash="hash1", cost_usd=0.5, speculation_parent_id="parent-1")
+		branch2 = _branch(id="b-2", commit_hash="hash2", cost_usd=0.3, speculation_parent_id="parent-1")
 
 		# Mock blocking review to return different scores
 		review1 = UnitReview(avg_score=7.0)
@@ -316,38 +338,27 @@ class TestSpeculationWinnerByReviewScore:
 		await controller._speculation_select_winner("parent-1", mission, epoch)
 
 		# branch2 has higher score, should be winner
-		controller._green_branch.merge_unit.assert_called_once_with("/ws2", branch2.branch_name)
+		green_branch.merge_unit.assert_called_once_with("/ws2", branch2.branch_name)
 		assert parent.status == "completed"
 		assert controller._total_merged == 1
 		# Loser workspace released
-		controller._backend.release_workspace.assert_called_once_with("/ws1")
+		backend.release_workspace.assert_called_once_with("/ws1")
 
 
 class TestSpeculationAllBranchesFail:
 	@pytest.mark.asyncio
 	async def test_parent_marked_failed(self, db: Database) -> None:
 		"""When all branches fail, parent should be marked failed."""
-		config = _make_config()
-		controller = ContinuousController(config, db)
-		controller._backend = AsyncMock()
-		controller._green_branch = AsyncMock()
+		controller, _, _ = _make_controller(db)
 
 		mission = Mission(id="m-1", objective="test")
 		epoch = Epoch(id="e-1", mission_id="m-1")
 
-		parent = WorkUnit(id="parent-f", plan_id="p-1", unit_type="speculation_parent")
+		parent = _parent(id="parent-f")
 		controller._speculation_parent_units["parent-f"] = parent
 
-		branch1 = WorkUnit(
-			id="bf-1", plan_id="p-1", status="failed",
-			cost_usd=0.4, unit_type="speculation_branch",
-			speculation_parent_id="parent-f",
-		)
-		branch2 = WorkUnit(
-			id="bf-2", plan_id="p-1", status="failed",
-			cost_usd=0.3, unit_type="speculation_branch",
-			speculation_parent_id="parent-f",
-		)
+		branch1 = _branch(id="bf-1", status="failed", cost_usd=0.4, speculation_parent_id="parent-f")
+		branch2 = _branch(id="bf-2", status="failed", cost_usd=0.3, speculation_parent_id="parent-f")
 
 		controller._speculation_completions["parent-f"] = [
 			WorkerCompletion(unit=branch1, handoff=None, workspace="/ws1", epoch=epoch),
@@ -362,30 +373,37 @@ class TestSpeculationAllBranchesFail:
 
 
 class TestSpeculationCostCapFallback:
+	@pytest.mark.parametrize("spent,expected", [
+		pytest.param(8.0, True, id="over-budget"),
+		pytest.param(0.0, False, id="within-budget"),
+	])
+	def test_exceeds_budget(self, db: Database, spent: float, expected: bool) -> None:
+		"""EMA $5 -> 2 branches * $5 * 1.5 = $15 projected against a $20 run budget."""
+		config = _make_config()
+		config.scheduler.budget.max_per_run_usd = 20.0
+		controller = ContinuousController(config, db)
+		controller._ema._ema = 5.0
+		controller._ema._count = 1
+
+		mission = Mission(id="m-1", objective="test", total_cost_usd=spent)
+		assert controller._speculation_exceeds_budget(mission) is expected
+
 	@pytest.mark.asyncio
 	async def test_falls_back_to_single_dispatch(self, db: Database) -> None:
-		"""When projected cost exceeds remaining budget, should return False."""
+		"""Over budget, dispatch returns False before inserting the speculation parent."""
 		config = _make_config()
 		config.scheduler.budget.max_per_run_usd = 10.0
 		controller = ContinuousController(config, db)
-		controller._backend = AsyncMock()
-
-		# EMA value of $5 -> 2 branches * $5 * 1.5 = $15 > $2 remaining
 		controller._ema._ema = 5.0
 		controller._ema._count = 1
 
 		mission = Mission(id="m-1", objective="test", total_cost_usd=8.0)
 		epoch = Epoch(id="e-1")
-		controller._semaphore = DynamicSemaphore(4)
-		unit = WorkUnit(
-			id="wu-cost", plan_id="p-1", speculation_score=0.9,
-			unit_type="implementation",
-		)
+		unit = WorkUnit(id="wu-cost", plan_id="p-1", speculation_score=0.9, unit_type="implementation")
 
-		result = await controller._dispatch_speculated_unit(
-			unit, epoch, mission, {},
-		)
-		assert result is False
+		assert await controller._dispatch_speculated_unit(unit, epoch, mission, {}) is False
+		assert db.get_work_unit("wu-cost") is None
+		assert unit.unit_type == "implementation"
 
 
 class TestSpeculationResultRecorded:
@@ -393,26 +411,16 @@ class TestSpeculationResultRecorded:
 	async def test_result_persisted(self, db: Database) -> None:
 		"""After selection, a SpeculationResult should be in the DB."""
 		config = _make_config(**{"speculation.selection_metric": "status"})
-		controller = ContinuousController(config, db)
-		controller._backend = AsyncMock()
-		controller._green_branch = AsyncMock()
-		controller._green_branch.merge_unit = AsyncMock(
-			return_value=MagicMock(merged=True, merge_commit_hash="abc"),
-		)
-		controller._planner = MagicMock()
+		controller, _, _ = _make_controller(db, config)
 
 		mission, plan = _create_mission_and_plan(db)
 		epoch = Epoch(id="e-1", mission_id="m-1")
 		db.insert_epoch(epoch)
 
-		parent = WorkUnit(id="parent-r", plan_id="p-1", unit_type="speculation_parent")
+		parent = _parent(id="parent-r")
 		controller._speculation_parent_units["parent-r"] = parent
 
-		branch1 = WorkUnit(
-			id="br-1", plan_id="p-1", status="completed",
-			commit_hash="h1", cost_usd=0.5, unit_type="speculation_branch",
-			speculation_parent_id="parent-r",
-		)
+		branch1 = _branch(id="br-1", commit_hash="h1", cost_usd=0.5, speculation_parent_id="parent-r")
 
 		controller._speculation_completions["parent-r"] = [
 			WorkerCompletion(unit=branch1, handoff=None, workspace="/ws1", epoch=epoch),
@@ -433,28 +441,16 @@ class TestSpeculationLoserWorkspacesReleased:
 	async def test_loser_released(self, db: Database) -> None:
 		"""Loser workspaces should be released after winner selection."""
 		config = _make_config(**{"speculation.selection_metric": "status"})
-		controller = ContinuousController(config, db)
-		controller._backend = AsyncMock()
-		controller._green_branch = AsyncMock()
-		controller._green_branch.merge_unit = AsyncMock(
-			return_value=MagicMock(merged=True, merge_commit_hash="abc"),
-		)
-		controller._planner = MagicMock()
+		controller, backend, _ = _make_controller(db, config)
 
 		mission = Mission(id="m-1", objective="test")
 		epoch = Epoch(id="e-1", mission_id="m-1")
 
-		parent = WorkUnit(id="parent-ws", plan_id="p-1", unit_type="speculation_parent")
+		parent = _parent(id="parent-ws")
 		controller._speculation_parent_units["parent-ws"] = parent
 
-		branch1 = WorkUnit(
-			id="bw-1", plan_id="p-1", status="completed",
-			commit_hash="h1", cost_usd=0.5, unit_type="speculation_branch",
-		)
-		branch2 = WorkUnit(
-			id="bw-2", plan_id="p-1", status="completed",
-			commit_hash="h2", cost_usd=0.3, unit_type="speculation_branch",
-		)
+		branch1 = _branch(id="bw-1", commit_hash="h1", cost_usd=0.5)
+		branch2 = _branch(id="bw-2", commit_hash="h2", cost_usd=0.3)
 
 		controller._speculation_completions["parent-ws"] = [
 			WorkerCompletion(unit=branch1, handoff=None, workspace="/ws-winner", epoch=epoch),
@@ -464,7 +460,7 @@ class TestSpeculationLoserWorkspacesReleased:
 		await controller._speculation_select_winner("parent-ws", mission, epoch)
 
 		# One of the workspaces should have been released (the loser)
-		release_calls = controller._backend.release_workspace.call_args_list
+		release_calls = backend.release_workspace.call_args_list
 		released_workspaces = {call.args[0] for call in release_calls}
 		# The winner workspace should not be released, the loser should
 		assert len(released_workspaces) == 1
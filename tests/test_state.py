@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from autodev.models import Snapshot, VerificationNodeKind
 from autodev.state import (
 	_build_result_from_single_command,
@@ -124,43 +126,46 @@ Found 2 errors in 2 files"""
 		assert result["type_errors"] == 2
 
 
-class TestCompareSnapshots:
-	def test_improvement(self) -> None:
-		before = Snapshot(test_total=10, test_passed=8, test_failed=2, lint_errors=5)
-		after = Snapshot(test_total=10, test_passed=10, test_failed=0, lint_errors=3)
-		delta = compare_snapshots(before, after)
-		assert delta.tests_fixed == 2
-		assert delta.tests_broken == 0
-		assert delta.lint_delta == -2
-		assert delta.improved is True
-		assert delta.regressed is False
-
-	def test_regression(self) -> None:
-		before = Snapshot(test_total=10, test_passed=10, test_failed=0)
-		after = Snapshot(test_total=10, test_passed=8, test_failed=2)
-		delta = compare_snapshots(before, after)
-		assert delta.tests_broken == 2
-		assert delta.regressed is True
-
-	def test_neutral(self) -> None:
-		before = Snapshot(test_total=10, test_passed=10, test_failed=0)
-		after = Snapshot(test_total=10, test_passed=10, test_failed=0)
-		delta = compare_snapshots(before, after)
-		assert delta.improved is False
-		assert delta.regressed is False
+_COMPARE_CASES = [
+	pytest.param(
+		Snapshot(test_total=10, test_passed=8, test_failed=2, lint_errors=5),
+		Snapshot(test_total=10, test_passed=10, test_failed=0, lint_errors=3),
+		{"tests_fixed": 2, "tests_broken": 0, "lint_delta": -2, "improved": True, "regressed": False},
+		id="improvement",
+	),
+	pytest.param(
+		Snapshot(test_total=10, test_passed=10, test_failed=0),
+		Snapshot(test_total=10, test_passed=8, test_failed=2),
+		{"tests_broken": 2, "regressed": True},
+		id="regression",
+	),
+	pytest.param(
+		Snapshot(test_total=10, test_passed=10, test_failed=0),
+		Snapshot(test_total=10, test_passed=10, test_failed=0),
+		{"improved": False, "regressed": False},
+		id="neutral",
+	),
+	pytest.param(
+		Snapshot(security_findings=0),
+		Snapshot(security_findings=2),
+		{"regressed": True},
+		id="security-regression",
+	),
+	pytest.param(
+		Snapshot(test_total=10, test_passed=10, test_failed=0, lint_errors=10),
+		Snapshot(test_total=10, test_passed=9, test_failed=1, lint_errors=0),
+		{"regressed": True, "improved": False},
+		id="mixed-lint-improvement-with-test-break",
+	),
+]
 
-	def test_security_regression(self) -> None:
-		before = Snapshot(security_findings=0)
-		after = Snapshot(security_findings=2)
-		delta = compare_snapshots(before, after)
-		assert delta.regressed is True
 
-	def test_mixed_lint_improvement_with_test_break(self) -> None:
-		before = Snapshot(test_total=10, test_passed=10, test_failed=0, lint_errors=10)
-		after = Snapshot(test_total=10, test_passed=9, test_failed=1, lint_errors=0)
+class TestCompareSnapshots:
+	@pytest.mark.parametrize("before,after,expected", _COMPARE_CASES)
+	def test_compare(self, before: Snapshot, after: Snapshot, expected: dict[str, object]) -> None:
 		delta = compare_snapshots(before, after)
-		assert delta.regressed is True
-		assert delta.improved is False
+		for field, value in expected.items():
+			assert getattr(delta, field) == value, field
 
 
 class TestRunCommandTimeout:
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from autodev.swarm.context import (
 	DEFAULT_KEEP_MESSAGES,
 	DEFAULT_MAX_INBOX_BYTES,
@@ -249,23 +252,15 @@ class TestRenderForPlanner:
 
 
 class TestHelperMethods:
-	def test_format_elapsed_seconds(self) -> None:
-		from datetime import datetime, timezone
-		now = datetime(2025, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
-		assert ContextSynthesizer._format_elapsed("2025-01-01T12:00:00+00:00", now) == "30s"
-
-	def test_format_elapsed_minutes(self) -> None:
-		from datetime import datetime, timezone
-		now = datetime(2025, 1, 1, 12, 5, 30, tzinfo=timezone.utc)
-		assert ContextSynthesizer._format_elapsed("2025-01-01T12:00:00+00:00", now) == "5m30s"
-
-	def test_format_elapsed_hours(self) -> None:
-		from datetime import datetime, timezone
-		now = datetime(2025, 1, 1, 13, 5, 0, tzinfo=timezone.utc)
-		assert ContextSynthesizer._format_elapsed("2025-01-01T12:00:00+00:00", now) == "1h5m"
+	@pytest.mark.parametrize("now,expected", [
+		(datetime(2025, 1, 1, 12, 0, 30, tzinfo=timezone.utc), "30s"),
+		(datetime(2025, 1, 1, 12, 5, 30, tzinfo=timezone.utc), "5m30s"),
+		(datetime(2025, 1, 1, 13, 5, 0, tzinfo=timezone.utc), "1h5m"),
+	])
+	def test_format_elapsed(self, now: datetime, expected: str) -> None:
+		assert ContextSynthesizer._format_elapsed("2025-01-01T12:00:00+00:00", now) == expected
 
 	def test_format_elapsed_invalid(self) -> None:
-		from datetime import datetime, timezone
 		now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 		assert ContextSynthesizer._format_elapsed("not-a-date", now) == "?"
 
@@ -295,15 +290,13 @@ class TestHelperMethods:
 		assert counts["failed"] == 1
 		assert counts["blocked"] == 1  # pending with deps counts as blocked
 
-	def test_resolve_claimer_name_found(self) -> None:
-		agents = [SwarmAgent(id="a1", name="worker-1")]
-		assert ContextSynthesizer._resolve_claimer_name("a1", agents) == "worker-1"
-
-	def test_resolve_claimer_name_not_found(self) -> None:
-		assert ContextSynthesizer._resolve_claimer_name("unknown123", []) == "unknown1"
-
-	def test_resolve_claimer_name_none(self) -> None:
-		assert ContextSynthesizer._resolve_claimer_name(None, []) == "?"
+	@pytest.mark.parametrize("agent_id,agents,expected", [
+		("a1", [SwarmAgent(id="a1", name="worker-1")], "worker-1"),
+		("unknown123", [], "unknown1"),
+		(None, [], "?"),
+	])
+	def test_resolve_claimer_name(self, agent_id: str | None, agents: list[SwarmAgent], expected: str) -> None:
+		assert ContextSynthesizer._resolve_claimer_name(agent_id, agents) == expected
 
 	def test_build_agent_task_map_completed(self) -> None:
 		task = SwarmTask(id="t1", title="Fix bug", status=TaskStatus.COMPLETED, result_summary="Done")
@@ -339,28 +339,21 @@ class TestDecisionPriority:
 
 
 class TestDeadAgentCleanup:
-	def test_cleanup_removes_old_dead_agents(self, tmp_path: Path) -> None:
-		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db())
-		agent = SwarmAgent(name="old-dead", status=AgentStatus.DEAD)
-		agent.death_time = time.monotonic() - 600  # 10 min ago
-		ctrl._agents[agent.id] = agent
-
-		ctrl._cleanup_dead_agents()
-
-		assert agent.id not in ctrl._agents
-		assert len(ctrl._dead_agent_history) == 1
-		assert ctrl._dead_agent_history[0].name == "old-dead"
-
-	def test_cleanup_keeps_recently_dead_agents(self, tmp_path: Path) -> None:
-		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db())
-		agent = SwarmAgent(name="fresh-dead", status=AgentStatus.DEAD)
-		agent.death_time = time.monotonic() - 60  # 1 min ago
+	@pytest.mark.parametrize(("death_time", "evicted"), [
+		(400.0, True),  # 10 min ago
+		(700.0, True),  # exactly at the 5 min threshold
+		(940.0, False),  # 1 min ago
+	])
+	def test_cleanup_evicts_by_age(self, tmp_path: Path, death_time: float, evicted: bool) -> None:
+		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db(), clock=lambda: 1000.0)
+		agent = SwarmAgent(name="dead", status=AgentStatus.DEAD)
+		agent.death_time = death_time
 		ctrl._agents[agent.id] = agent
 
 		ctrl._cleanup_dead_agents()
 
-		assert agent.id in ctrl._agents
-		assert len(ctrl._dead_agent_history) == 0
+		assert (agent.id not in ctrl._agents) is evicted
+		assert [a.name for a in ctrl._dead_agent_history] == (["dead"] if evicted else [])
 
 	def test_cleanup_ignores_living_agents(self, tmp_path: Path) -> None:
 		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db())
@@ -373,9 +366,9 @@ class TestDeadAgentCleanup:
 		assert len(ctrl._dead_agent_history) == 0
 
 	def test_cleanup_removes_stale_process_entries(self, tmp_path: Path) -> None:
-		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db())
+		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db(), clock=lambda: 1000.0)
 		agent = SwarmAgent(name="dead-proc", status=AgentStatus.DEAD)
-		agent.death_time = time.monotonic() - 600
+		agent.death_time = 400.0
 		ctrl._agents[agent.id] = agent
 		ctrl._processes[agent.id] = MagicMock()
 
@@ -384,14 +377,14 @@ class TestDeadAgentCleanup:
 		assert agent.id not in ctrl._processes
 
 	def test_cleanup_bounds_history_size(self, tmp_path: Path) -> None:
-		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db())
+		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db(), clock=lambda: 1000.0)
 		# Pre-fill history to max
 		for i in range(50):
 			ctrl._dead_agent_history.append(SwarmAgent(name=f"old-{i}"))
 
 		# Add one more dead agent to trigger cleanup
 		agent = SwarmAgent(name="overflow", status=AgentStatus.DEAD)
-		agent.death_time = time.monotonic() - 600
+		agent.death_time = 400.0
 		ctrl._agents[agent.id] = agent
 
 		ctrl._cleanup_dead_agents()
@@ -400,7 +393,7 @@ class TestDeadAgentCleanup:
 		assert ctrl._dead_agent_history[-1].name == "overflow"
 
 	def test_cleanup_sets_death_time_on_legacy_agents(self, tmp_path: Path) -> None:
-		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db())
+		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db(), clock=lambda: 1000.0)
 		agent = SwarmAgent(name="legacy", status=AgentStatus.DEAD)
 		# death_time is None (legacy agent)
 		ctrl._agents[agent.id] = agent
@@ -409,13 +402,13 @@ class TestDeadAgentCleanup:
 
 		# Should set death_time but not remove yet
 		assert agent.id in ctrl._agents
-		assert agent.death_time is not None
+		assert agent.death_time == 1000.0
 
 	async def test_monitor_agents_calls_cleanup(self, tmp_path: Path) -> None:
-		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db())
+		ctrl = SwarmController(_make_config(tmp_path), _make_swarm_config(), _make_db(), clock=lambda: 1000.0)
 		# Add a dead agent that's old enough to clean
 		agent = SwarmAgent(name="monitored-dead", status=AgentStatus.DEAD)
-		agent.death_time = time.monotonic() - 600
+		agent.death_time = 400.0
 		ctrl._agents[agent.id] = agent
 
 		await ctrl.monitor_agents()
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
+
 from autodev.config import SwarmConfig
 from autodev.swarm.models import (
 	AgentRole,
@@ -186,98 +189,60 @@ class TestVerificationSection:
 		assert text == ""
 
 
+def _build_prompt(
+	tmp_path: Path,
+	config: MagicMock | None = None,
+	agents: list[SwarmAgent] | None = None,
+	goal_context: str = "",
+) -> str:
+	agent = _make_agent()
+	return build_worker_prompt(
+		agent=agent,
+		task_prompt="Fix the compiler bug in codegen.c",
+		team_name="autodev-test",
+		agents=[agent] if agents is None else agents,
+		tasks=[],
+		config=config or _make_config(tmp_path),
+		swarm_config=_make_swarm_config(),
+		goal_context=goal_context,
+	)
+
+
 class TestBuildWorkerPrompt:
-	def test_includes_task_and_identity(self, tmp_path: Path) -> None:
-		agent = _make_agent()
-		prompt = build_worker_prompt(
-			agent=agent,
-			task_prompt="Fix the compiler bug in codegen.c",
-			team_name="autodev-test",
-			agents=[agent],
-			tasks=[],
-			config=_make_config(tmp_path),
-			swarm_config=_make_swarm_config(),
-		)
-		assert "Fix the compiler bug" in prompt
-		assert "worker-1" in prompt
-		assert "AD_RESULT" in prompt
+	@pytest.mark.parametrize("overrides,present,absent", [
+		pytest.param({}, ["Fix the compiler bug", "worker-1", "AD_RESULT"], ["## Goal Fitness"], id="defaults"),
+		pytest.param(
+			{"agents": [_make_agent(), _make_agent(name="a2", role=AgentRole.TESTER)]},
+			["a2", "tester"], [], id="peer-info",
+		),
+		pytest.param(
+			{"goal_context": "Goal: Quality\nComposite: 0.850 / 1.000\nGap: 0.150"},
+			["## Goal Fitness", "Composite: 0.850"], [], id="goal-context",
+		),
+	])
+	def test_prompt_sections(
+		self, tmp_path: Path, overrides: dict[str, Any], present: list[str], absent: list[str],
+	) -> None:
+		prompt = _build_prompt(tmp_path, **overrides)
+		for text in present:
+			assert text in prompt
+		for text in absent:
+			assert text not in prompt
 
 	def test_verification_section_included(self, tmp_path: Path) -> None:
-		agent = _make_agent()
 		config = _make_config(tmp_path)
 		config.target.verification.command = "make test"
-		prompt = build_worker_prompt(
-			agent=agent,
-			task_prompt="Implement feature",
-			team_name="autodev-test",
-			agents=[agent],
-			tasks=[],
-			config=config,
-			swarm_config=_make_swarm_config(),
-		)
+		prompt = _build_prompt(tmp_path, config)
 		assert "Self-Verification" in prompt
 		assert "make test" in prompt
 
 	def test_verification_section_missing_command(self, tmp_path: Path) -> None:
-		agent = _make_agent()
 		config = _make_config(tmp_path)
 		config.target.verification = None
-		prompt = build_worker_prompt(
-			agent=agent,
-			task_prompt="Implement feature",
-			team_name="autodev-test",
-			agents=[agent],
-			tasks=[],
-			config=config,
-			swarm_config=_make_swarm_config(),
-		)
+		prompt = _build_prompt(tmp_path, config)
 		assert "Self-Verification" not in prompt
 		assert "AD_RESULT" in prompt
 
-	def test_includes_peer_info(self, tmp_path: Path) -> None:
-		agent = _make_agent(name="a1")
-		peer = _make_agent(name="a2", role=AgentRole.TESTER)
-		prompt = build_worker_prompt(
-			agent=agent,
-			task_prompt="Do stuff",
-			team_name="autodev-test",
-			agents=[agent, peer],
-			tasks=[],
-			config=_make_config(tmp_path),
-			swarm_config=_make_swarm_config(),
-		)
-		assert "a2" in prompt
-		assert "tester" in prompt
-
-	def test_includes_goal_context(self, tmp_path: Path) -> None:
-		agent = _make_agent()
-		goal_ctx = "Goal: Quality\nComposite: 0.850 / 1.000\nGap: 0.150"
-		prompt = build_worker_prompt(
-			agent=agent,
-			task_prompt="Improve quality",
-			team_name="autodev-test",
-			agents=[agent],
-			tasks=[],
-			config=_make_config(tmp_path),
-			swarm_config=_make_swarm_config(),
-			goal_context=goal_ctx,
-		)
-		assert "## Goal Fitness" in prompt
-		assert "Composite: 0.850" in prompt
-
-	def test_no_goal_section_when_empty(self, tmp_path: Path) -> None:
-		agent = _make_agent()
-		prompt = build_worker_prompt(
-			agent=agent,
-			task_prompt="Do stuff",
-			team_name="autodev-test",
-			agents=[agent],
-			tasks=[],
-			config=_make_config(tmp_path),
-			swarm_config=_make_swarm_config(),
-		)
-		assert "## Goal Fitness" not in prompt
-
 
 class TestGoalFitnessSection:
 	def test_returns_section_with_content(self) -> None:
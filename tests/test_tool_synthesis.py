@@ -113,18 +113,13 @@ class TestToolRegistryList:
 	def test_list_empty(self, registry: ToolRegistry) -> None:
 		assert registry.list_tools() == []
 
-	def test_list_sorted_by_name(self, registry: ToolRegistry) -> None:
+	def test_list_sorted_tool_entries(self, registry: ToolRegistry) -> None:
 		registry.register_tool("zeta", "print('z')")
-		registry.register_tool("alpha", "print('a')")
+		registry.register_tool("alpha", "print('a')", description="First tool")
 		registry.register_tool("mid", "print('m')")
 		tools = registry.list_tools()
 		assert [t.name for t in tools] == ["alpha", "mid", "zeta"]
-
-	def test_list_returns_tool_entries(self, registry: ToolRegistry) -> None:
-		registry.register_tool("tool1", "print(1)", description="First tool")
-		tools = registry.list_tools()
-		assert len(tools) == 1
-		assert isinstance(tools[0], ToolEntry)
+		assert all(isinstance(t, ToolEntry) for t in tools)
 		assert tools[0].description == "First tool"
 
 
@@ -135,16 +130,11 @@ class TestToolRegistryOverwrite:
 	def test_duplicate_name_overwrites(self, registry: ToolRegistry) -> None:
 		registry.register_tool("dup", "print('v1')", description="Version 1")
 		registry.register_tool("dup", "print('v2')", description="Version 2")
+		assert len(registry.list_tools()) == 1
 		entry = registry.get_tool("dup")
 		assert entry is not None
 		assert entry.description == "Version 2"
-		content = entry.script_path.read_text()
-		assert "v2" in content
-
-	def test_duplicate_name_keeps_single_entry(self, registry: ToolRegistry) -> None:
-		registry.register_tool("dup", "print('v1')")
-		registry.register_tool("dup", "print('v2')")
-		assert len(registry.list_tools()) == 1
+		assert "v2" in entry.script_path.read_text()
 
 
 # ── Filesystem persistence ──────────────────────────────────────────────
@@ -173,14 +163,16 @@ class TestToolPersistence:
 		assert tools[0].name == "persist_me"
 		assert tools[0].description == "A persistent tool"
 
-	def test_reload_tool_without_description_comment(self, workspace: Path, config_with_tools: MissionConfig) -> None:
-		reg1 = ToolRegistry(workspace, config_with_tools)
-		reg1.register_tool("nodesc", "print('no desc')")
-
-		reg2 = ToolRegistry(workspace, config_with_tools)
-		entry = reg2.get_tool("nodesc")
-		assert entry is not None
-		assert entry.description == ""
+	@pytest.mark.parametrize("first_line,description", [
+		pytest.param("# A persistent tool\n", "A persistent tool", id="comment"),
+		pytest.param("print('no desc')\n", "", id="no-comment"),
+		pytest.param("", "", id="empty-file"),
+	])
+	def test_parse_script(self, first_line: str, description: str) -> None:
+		entry = ToolRegistry._parse_script(Path("tools/persist_me.py"), first_line)
+		assert entry.name == "persist_me"
+		assert entry.description == description
+		assert entry.script_path == Path("tools/persist_me.py")
 
 	def test_reload_multiple_tools_sorted(self, workspace: Path, config_with_tools: MissionConfig) -> None:
 		reg1 = ToolRegistry(workspace, config_with_tools)
@@ -271,6 +263,15 @@ class TestRenderAvailableToolsSection:
 	def test_no_tools_returns_empty(self, registry: ToolRegistry) -> None:
 		assert render_available_tools_section(registry) == ""
 
+	def test_cached_section_invalidated_on_change(self, registry: ToolRegistry) -> None:
+		assert render_available_tools_section(registry) == ""
+		registry.register_tool("analyzer", "print('analyze')")
+		section = render_available_tools_section(registry)
+		assert "### analyzer" in section
+		assert render_available_tools_section(registry) is section
+		registry.cleanup_all()
+		assert render_available_tools_section(registry) == ""
+
 	def test_with_tools_returns_section(self, registry: ToolRegistry) -> None:
 		registry.register_tool("analyzer", "print('analyze')", description="Code analyzer")
 		section = render_available_tools_section(registry)
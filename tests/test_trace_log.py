@@ -5,30 +5,27 @@ from __future__ import annotations
 import json
 import threading
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from autodev.trace_log import TraceEvent, TraceLogConfig, TraceLogger
 
+_EVENT_DICT: dict[str, Any] = {
+	"timestamp": "2026-01-01T00:00:00+00:00",
+	"worker_id": "w1",
+	"unit_id": "u1",
+	"event_type": "spawn",
+	"details": {"pid": 1234},
+}
+
 
 class TestTraceEvent:
 	def test_to_dict_produces_json_serializable_dict(self) -> None:
-		event = TraceEvent(
-			timestamp="2026-01-01T00:00:00+00:00",
-			worker_id="w1",
-			unit_id="u1",
-			event_type="spawn",
-			details={"pid": 1234},
-		)
-		d = event.to_dict()
-		assert d == {
-			"timestamp": "2026-01-01T00:00:00+00:00",
-			"worker_id": "w1",
-			"unit_id": "u1",
-			"event_type": "spawn",
-			"details": {"pid": 1234},
-		}
+		d = TraceEvent(**_EVENT_DICT).to_dict()
+		assert d == _EVENT_DICT
 		# Must be JSON-serializable
-		serialized = json.dumps(d)
-		assert json.loads(serialized) == d
+		assert json.loads(json.dumps(d)) == d
 
 	def test_from_dict_round_trips(self) -> None:
 		original = TraceEvent(
@@ -38,27 +35,11 @@ class TestTraceEvent:
 			event_type="merge",
 			details={"branch": "autodev/green", "success": True},
 		)
-		d = original.to_dict()
-		restored = TraceEvent.from_dict(d)
-		assert restored.timestamp == original.timestamp
-		assert restored.worker_id == original.worker_id
-		assert restored.unit_id == original.unit_id
-		assert restored.event_type == original.event_type
-		assert restored.details == original.details
+		assert TraceEvent.from_dict(original.to_dict()) == original
 
 	def test_from_dict_tolerates_extra_keys(self) -> None:
-		data = {
-			"timestamp": "2026-01-01T00:00:00+00:00",
-			"worker_id": "w1",
-			"unit_id": "u1",
-			"event_type": "spawn",
-			"details": {},
-			"extra_field": "should be ignored",
-			"another": 42,
-		}
-		event = TraceEvent.from_dict(data)
-		assert event.worker_id == "w1"
-		assert event.event_type == "spawn"
+		event = TraceEvent.from_dict({**_EVENT_DICT, "extra_field": "should be ignored", "another": 42})
+		assert event == TraceEvent(**_EVENT_DICT)
 		assert not hasattr(event, "extra_field")
 
 
@@ -131,7 +112,8 @@ class TestTraceLoggerRotation:
 
 
 class TestTraceLoggerThreadSafety:
-	def test_concurrent_writes_produce_correct_line_count(self, tmp_path: Path) -> None:
+	@pytest.mark.parametrize("batch_size", [pytest.param(1, id="write"), pytest.param(50, id="write_many")])
+	def test_concurrent_writes_produce_correct_line_count(self, tmp_path: Path, batch_size: int) -> None:
 		trace_file = tmp_path / "trace.jsonl"
 		# Use a large max_file_size to avoid rotation during this test
 		config = TraceLogConfig(enabled=True, path=str(trace_file), max_file_size=50_000_000)
@@ -142,14 +124,17 @@ class TestTraceLoggerThreadSafety:
 		barrier = threading.Barrier(num_threads)
 
 		def writer(tid: int) -> None:
+			events = [
+				TraceEvent(worker_id=f"t{tid}", event_type="concurrent", details={"seq": i})
+				for i in range(events_per_thread)
+			]
 			barrier.wait()
-			for i in range(events_per_thread):
-				event = TraceEvent(
-					worker_id=f"t{tid}",
-					event_type="concurrent",
-					details={"seq": i},
-				)
-				logger.write(event)
+			if batch_size == 1:
+				for event in events:
+					logger.write(event)
+				return
+			for start in range(0, events_per_thread, batch_size):
+				logger.write_many(events[start:start + batch_size])
 
 		threads = [threading.Thread(target=writer, args=(t,)) for t in range(num_threads)]
 		for t in threads:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
 from autodev.config import MissionConfig, TargetConfig, VerificationConfig, VerificationNodeConfig
 from autodev.models import VerificationNodeKind, VerificationReport, VerificationResult
 from autodev.state import run_verification_nodes, snapshot_project_health
@@ -30,56 +32,40 @@ class TestVerificationResult:
 		assert r.kind == VerificationNodeKind.PYTEST
 
 
-class TestVerificationReport:
-	def test_overall_passed_all_pass(self) -> None:
-		report = VerificationReport(results=[
-			VerificationResult(passed=True, required=True),
-			VerificationResult(passed=True, required=True),
-		])
-		assert report.overall_passed is True
+_PYTEST = VerificationNodeKind.PYTEST
+_RUFF = VerificationNodeKind.RUFF
+_MYPY = VerificationNodeKind.MYPY
+_CUSTOM = VerificationNodeKind.CUSTOM
 
-	def test_overall_passed_required_fails(self) -> None:
-		report = VerificationReport(results=[
-			VerificationResult(passed=True, required=True),
-			VerificationResult(passed=False, required=True),
-		])
-		assert report.overall_passed is False
-
-	def test_overall_passed_optional_fails(self) -> None:
-		report = VerificationReport(results=[
-			VerificationResult(passed=True, required=True),
-			VerificationResult(passed=False, required=False),
-		])
-		assert report.overall_passed is True
 
-	def test_weighted_score(self) -> None:
-		report = VerificationReport(results=[
-			VerificationResult(passed=True, weight=2.0),
-			VerificationResult(passed=False, weight=1.0),
-			VerificationResult(passed=True, weight=3.0),
-		])
-		assert report.weighted_score == 5.0
-
-	def test_weighted_score_empty(self) -> None:
-		report = VerificationReport(results=[])
-		assert report.weighted_score == 0.0
-
-	def test_failed_kinds(self) -> None:
-		report = VerificationReport(results=[
-			VerificationResult(kind=VerificationNodeKind.PYTEST, passed=True),
-			VerificationResult(kind=VerificationNodeKind.RUFF, passed=False),
-			VerificationResult(kind=VerificationNodeKind.MYPY, passed=False),
-		])
-		failed = report.failed_kinds()
-		assert VerificationNodeKind.RUFF in failed
-		assert VerificationNodeKind.MYPY in failed
-		assert VerificationNodeKind.PYTEST not in failed
-
-	def test_failed_kinds_empty_when_all_pass(self) -> None:
-		report = VerificationReport(results=[
-			VerificationResult(kind=VerificationNodeKind.PYTEST, passed=True),
-		])
-		assert report.failed_kinds() == []
+def _result(
+	passed: bool, required: bool = True, weight: float = 1.0, kind: VerificationNodeKind = _CUSTOM,
+) -> VerificationResult:
+	return VerificationResult(kind=kind, passed=passed, required=required, weight=weight)
+
+
+class TestVerificationReport:
+	@pytest.mark.parametrize("results,overall,score,failed", [
+		pytest.param([_result(True), _result(True)], True, 2.0, [], id="all-pass"),
+		pytest.param([_result(True), _result(False)], False, 1.0, [_CUSTOM], id="required-fails"),
+		pytest.param([_result(True), _result(False, required=False)], True, 1.0, [_CUSTOM], id="optional-fails"),
+		pytest.param(
+			[_result(True, weight=2.0), _result(False, weight=1.0), _result(True, weight=3.0)],
+			False, 5.0, [_CUSTOM], id="weighted",
+		),
+		pytest.param([], False, 0.0, [], id="empty"),
+		pytest.param(
+			[_result(True, kind=_PYTEST), _result(False, kind=_RUFF), _result(False, kind=_MYPY)],
+			False, 1.0, [_RUFF, _MYPY], id="failed-kinds",
+		),
+	])
+	def test_report_properties(
+		self, results: list[VerificationResult], overall: bool, score: float, failed: list[VerificationNodeKind],
+	) -> None:
+		report = VerificationReport(results=results)
+		assert report.overall_passed is overall
+		assert report.weighted_score == score
+		assert report.failed_kinds() == failed
 
 
 class TestRunVerificationNodes:
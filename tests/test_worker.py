@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock, patch
 
@@ -24,6 +25,8 @@ from autodev.worker import (
 	render_worker_prompt,
 )
 
+_AD_COMPLETED = 'AD_RESULT:{"status":"completed","commits":["abc123"],"summary":"Fixed it","files_changed":["foo.py"]}'
+
 
 class MockBackend(WorkerBackend):
 	"""Minimal mock backend for tests."""
@@ -50,6 +53,20 @@ class MockBackend(WorkerBackend):
 		pass
 
 
+class _FakeProc:
+	"""Stand-in for an asyncio subprocess whose output is already available."""
+
+	def __init__(self, stdout: bytes = b"", returncode: int = 0) -> None:
+		self._stdout = stdout
+		self.returncode = returncode
+
+	async def communicate(self, input: bytes | None = None) -> tuple[bytes, bytes]:
+		return self._stdout, b""
+
+	async def wait(self) -> int:
+		return self.returncode
+
+
 @pytest.fixture()
 def mock_backend() -> MockBackend:
 	return MockBackend()
@@ -71,16 +88,11 @@ def worker_and_unit(db: Database) -> tuple[Worker, WorkUnit]:
 
 
 class TestRenderWorkerPrompt:
-	def test_contains_title(self, config: MissionConfig) -> None:
-		unit = WorkUnit(title="Fix lint", description="Fix ruff errors")
-		prompt = render_worker_prompt(unit, config, "/tmp/clone", "mc/unit-abc")
-		assert "Fix lint" in prompt
-		assert "Fix ruff errors" in prompt
-
-	def test_contains_files_hint(self, config: MissionConfig) -> None:
-		unit = WorkUnit(title="X", files_hint="src/foo.py,src/bar.py")
+	def test_contains_unit_fields(self, config: MissionConfig) -> None:
+		unit = WorkUnit(title="Fix lint", description="Fix ruff errors", files_hint="src/foo.py,src/bar.py")
 		prompt = render_worker_prompt(unit, config, "/tmp/clone", "mc/unit-abc")
-		assert "src/foo.py,src/bar.py" in prompt
+		for needle in ("Fix lint", "Fix ruff errors", "src/foo.py,src/bar.py", "pytest -q"):
+			assert needle in prompt
 
 	def test_per_unit_verification_command_override(self, config: MissionConfig) -> None:
 		"""Per-unit verification_command overrides config default."""
@@ -247,26 +259,37 @@ class TestWorkerAgent:
 		mock_backend: MockBackend,
 	) -> None:
 		w, wu = worker_and_unit
-		agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=1)
+		agent = WorkerAgent(w, db, config, mock_backend)
 
 		# Claim the unit manually so heartbeat has something to update
 		claimed = db.claim_work_unit(w.id)
 		assert claimed is not None
 
-		# Start heartbeat, let it fire once, then cancel
-		task = agent._heartbeat_loop()  # noqa: SLF001
-		ht = __import__("asyncio").create_task(task)
-		await __import__("asyncio").sleep(1.5)
-		ht.cancel()
-		try:
-			await ht
-		except __import__("asyncio").CancelledError:
-			pass
-
-		# Check heartbeat was updated
+		db.conn.execute("UPDATE work_units SET heartbeat_at='2000-01-01T00:00:00' WHERE id=?", (claimed.id,))
+
+		await agent._heartbeat_once()  # noqa: SLF001
+
 		refreshed = db.get_work_unit(claimed.id)
 		assert refreshed is not None
-		# heartbeat_at should have been updated (it was set during claim, then updated by heartbeat)
+		assert refreshed.heartbeat_at is not None
+		assert refreshed.heartbeat_at > "2000-01-01T00:00:00"
+
+	async def test_heartbeat_loop_sleeps_between_beats(
+		self, db: Database, config: MissionConfig, worker_and_unit: tuple[Worker, WorkUnit],
+		mock_backend: MockBackend,
+	) -> None:
+		w, _ = worker_and_unit
+		agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=7)
+		agent._heartbeat_once = AsyncMock()  # type: ignore[method-assign]  # noqa: SLF001
+
+		# First sleep returns immediately so one heartbeat fires; the second ends the loop
+		with patch("autodev.worker.asyncio.sleep", new_callable=AsyncMock) as msleep:
+			msleep.side_effect = [None, asyncio.CancelledError()]
+			with pytest.raises(asyncio.CancelledError):
+				await agent._heartbeat_loop()  # noqa: SLF001
+
+		msleep.assert_awaited_with(7)
+		agent._heartbeat_once.assert_awaited_once()  # noqa: SLF001
 
 	async def test_successful_unit_execution(
 		self, db: Database, config: MissionConfig, worker_and_unit: tuple[Worker, WorkUnit],
@@ -275,19 +298,14 @@ class TestWorkerAgent:
 		w, _ = worker_and_unit
 
 		# Configure mock backend to return AD_RESULT output
-		mc_output = (
-			'AD_RESULT:{"status":"completed","commits":["abc123"],'
-			'"summary":"Fixed it","files_changed":["foo.py"]}'
-		)
+		mc_output = _AD_COMPLETED
 		mock_backend.get_output = AsyncMock(return_value=mc_output)  # type: ignore[method-assign]
 
 		agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
 		agent.running = True
 
 		# Mock git subprocess (for checkout -b)
-		mock_git_proc = AsyncMock()
-		mock_git_proc.communicate = AsyncMock(return_value=(b"", b""))
-		mock_git_proc.returncode = 0
+		mock_git_proc = _FakeProc()
 
 		with patch("autodev.worker.asyncio.create_subprocess_exec", return_value=mock_git_proc):
 			unit = db.claim_work_unit(w.id)
@@ -328,9 +346,7 @@ class TestWorkerAgent:
 		agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
 		agent.running = True
 
-		mock_git_proc = AsyncMock()
-		mock_git_proc.communicate = AsyncMock(return_value=(b"", b""))
-		mock_git_proc.returncode = 0
+		mock_git_proc = _FakeProc()
 
 		with patch("autodev.worker.asyncio.create_subprocess_exec", return_value=mock_git_proc):
 			unit = db.claim_work_unit(w.id)
@@ -358,9 +374,7 @@ class TestWorkerAgent:
 		mock_backend.check_status = AsyncMock(return_value="failed")  # type: ignore[method-assign]
 		mock_backend.get_output = AsyncMock(return_value="Error: something broke")  # type: ignore[method-assign]
 
-		mock_git_proc = AsyncMock()
-		mock_git_proc.communicate = AsyncMock(return_value=(b"", b""))
-		mock_git_proc.returncode = 0
+		mock_git_proc = _FakeProc()
 
 		with patch("autodev.worker.asyncio.create_subprocess_exec", return_value=mock_git_proc):
 			agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
@@ -393,9 +407,7 @@ class TestWorkerAgent:
 		# Set a very short timeout so it triggers quickly
 		config.scheduler.session_timeout = 0
 
-		mock_git_proc = AsyncMock()
-		mock_git_proc.communicate = AsyncMock(return_value=(b"", b""))
-		mock_git_proc.returncode = 0
+		mock_git_proc = _FakeProc()
 
 		with patch("autodev.worker.asyncio.create_subprocess_exec", return_value=mock_git_proc):
 			agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
@@ -415,10 +427,7 @@ class TestWorkerAgent:
 		"""After successful unit, workspace checks out base branch but keeps feature branch for merge queue."""
 		w, _ = worker_and_unit
 
-		mc_output = (
-			'AD_RESULT:{"status":"completed","commits":["abc123"],'
-			'"summary":"Fixed it","files_changed":["foo.py"]}'
-		)
+		mc_output = _AD_COMPLETED
 		mock_backend.get_output = AsyncMock(return_value=mc_output)  # type: ignore[method-assign]
 
 		agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
@@ -454,9 +463,7 @@ class TestWorkerAgent:
 		db.update_work_unit(wu)
 
 		# Make git checkout always fail
-		mock_git_proc = AsyncMock()
-		mock_git_proc.communicate = AsyncMock(return_value=(b"error: branch exists", b""))
-		mock_git_proc.returncode = 1
+		mock_git_proc = _FakeProc(b"error: branch exists", returncode=1)
 
 		with patch("autodev.worker.asyncio.create_subprocess_exec", return_value=mock_git_proc):
 			agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
@@ -479,10 +486,7 @@ class TestWorkerAgent:
 
 		# Simulate a process that produces >64KB of output
 		large_output = "x" * 100_000  # 100KB of output
-		mc_line = (
-			'AD_RESULT:{"status":"completed","commits":["abc123"],'
-			'"summary":"Fixed it","files_changed":["foo.py"]}'
-		)
+		mc_line = _AD_COMPLETED
 		full_output = large_output + "\n" + mc_line
 
 		# Track get_output calls to verify draining happens during polling
@@ -507,9 +511,7 @@ class TestWorkerAgent:
 
 		agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
 
-		mock_git_proc = AsyncMock()
-		mock_git_proc.communicate = AsyncMock(return_value=(b"", b""))
-		mock_git_proc.returncode = 0
+		mock_git_proc = _FakeProc()
 
 		with patch("autodev.worker.asyncio.create_subprocess_exec", return_value=mock_git_proc):
 			unit = db.claim_work_unit(w.id)
@@ -581,10 +583,7 @@ class TestWorkerAgent:
 		)
 		db.insert_merge_request(mr)
 
-		mc_output = (
-			'AD_RESULT:{"status":"completed","commits":["abc123"],'
-			'"summary":"Fixed it","files_changed":["foo.py"]}'
-		)
+		mc_output = _AD_COMPLETED
 		mock_backend.get_output = AsyncMock(return_value=mc_output)  # type: ignore[method-assign]
 
 		agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
@@ -621,9 +620,7 @@ class TestWorkerAgent:
 		w, _ = worker_and_unit
 
 		# Create a process mock that fails with error output
-		mock_git_proc = AsyncMock()
-		mock_git_proc.communicate = AsyncMock(return_value=(b"fatal: not a git repository", b""))
-		mock_git_proc.returncode = 128
+		mock_git_proc = _FakeProc(b"fatal: not a git repository", returncode=128)
 
 		agent = WorkerAgent(w, db, config, mock_backend, heartbeat_interval=9999)
 
@@ -782,10 +779,7 @@ class TestModelSelection:
 		config.models = ModelsConfig(worker_model="sonnet")
 		config.scheduler.model = "opus"
 
-		mc_output = (
-			'AD_RESULT:{"status":"completed","commits":["abc123"],'
-			'"summary":"Fixed it","files_changed":["foo.py"]}'
-		)
+		mc_output = _AD_COMPLETED
 		mock_backend.get_output = AsyncMock(return_value=mc_output)  # type: ignore[method-assign]
 		mock_backend.spawn = AsyncMock(  # type: ignore[method-assign]
 			return_value=WorkerHandle(worker_id=w.id, pid=12345, workspace_path="/tmp/mock-workspace"),
@@ -818,10 +812,7 @@ class TestModelSelection:
 		# so remove models to test the fallback path
 		object.__setattr__(config, "models", None)
 
-		mc_output = (
-			'AD_RESULT:{"status":"completed","commits":["abc123"],'
-			'"summary":"Fixed it","files_changed":["foo.py"]}'
-		)
+		mc_output = _AD_COMPLETED
 		mock_backend.get_output = AsyncMock(return_value=mc_output)  # type: ignore[method-assign]
 		mock_backend.spawn = AsyncMock(  # type: ignore[method-assign]
 			return_value=WorkerHandle(worker_id=w.id, pid=12345, workspace_path="/tmp/mock-workspace"),
@@ -852,10 +843,7 @@ class TestModelSelection:
 		config.models = ModelsConfig()
 		config.scheduler.model = "haiku"
 
-		mc_output = (
-			'AD_RESULT:{"status":"completed","commits":["abc123"],'
-			'"summary":"Fixed it","files_changed":["foo.py"]}'
-		)
+		mc_output = _AD_COMPLETED
 		mock_backend.get_output = AsyncMock(return_value=mc_output)  # type: ignore[method-assign]
 		mock_backend.spawn = AsyncMock(  # type: ignore[method-assign]
 			return_value=WorkerHandle(worker_id=w.id, pid=12345, workspace_path="/tmp/mock-workspace"),
@@ -935,10 +923,7 @@ class TestArchitectEditorMode:
 		w, _ = worker_and_unit
 		config.models = ModelsConfig(architect_editor_mode=False)
 
-		mc_output = (
-			'AD_RESULT:{"status":"completed","commits":["abc123"],'
-			'"summary":"Fixed it","files_changed":["foo.py"]}'
-		)
+		mc_output = _AD_COMPLETED
 		mock_backend.get_output = AsyncMock(return_value=mc_output)  # type: ignore[method-assign]
 		mock_backend.spawn = AsyncMock(  # type: ignore[method-assign]
 			return_value=WorkerHandle(worker_id=w.id, pid=12345, workspace_path="/tmp/mock-workspace"),
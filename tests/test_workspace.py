@@ -3,37 +3,39 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import subprocess
 from pathlib import Path
 
 import pytest
 
 from autodev.workspace import WorkspacePool
 
+_GIT_ENV = {
+	"GIT_AUTHOR_NAME": "test", "GIT_AUTHOR_EMAIL": "test@test.com",
+	"GIT_COMMITTER_NAME": "test", "GIT_COMMITTER_EMAIL": "test@test.com",
+	"PATH": os.environ["PATH"],
+}
 
-@pytest.fixture()
-def source_repo(tmp_path: Path) -> Path:
-	"""Create a real git repo to use as the clone source."""
-	import subprocess
-
-	repo = tmp_path / "source"
-	repo.mkdir()
-	subprocess.run(["git", "init", str(repo)], check=True, capture_output=True)
-	subprocess.run(["git", "checkout", "-b", "main"], cwd=str(repo), check=True, capture_output=True)
-
-	# Create an initial commit so the branch exists
-	readme = repo / "README.md"
-	readme.write_text("# Test repo\n")
+
+def _init_repo(repo: Path) -> Path:
+	"""Create a real git repo on main with one commit."""
+	subprocess.run(["git", "init", "--initial-branch=main", str(repo)], check=True, capture_output=True)
+	(repo / "README.md").write_text("# Test repo\n")
 	subprocess.run(["git", "add", "."], cwd=str(repo), check=True, capture_output=True)
 	subprocess.run(
 		["git", "commit", "-m", "Initial commit"],
-		cwd=str(repo), check=True, capture_output=True,
-		env={"GIT_AUTHOR_NAME": "test", "GIT_AUTHOR_EMAIL": "test@test.com",
-			"GIT_COMMITTER_NAME": "test", "GIT_COMMITTER_EMAIL": "test@test.com",
-			"PATH": subprocess.check_output(["bash", "-c", "echo $PATH"]).decode().strip()},
+		cwd=str(repo), check=True, capture_output=True, env=_GIT_ENV,
 	)
 	return repo
 
 
+@pytest.fixture(scope="module")
+def source_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+	"""Clone source shared by the module; clones are --shared and never write back to it."""
+	return _init_repo(tmp_path_factory.mktemp("source"))
+
+
 @pytest.fixture()
 def pool_dir(tmp_path: Path) -> Path:
 	"""Directory for workspace clones."""
@@ -89,8 +91,7 @@ class TestWorkspacePool:
 
 		# Create a dirty file
 		dirty_file = workspace / "dirty.txt"
-		dirty_file.write_text("this should be cleaned up")
-		assert dirty_file.exists()
+		dirty_file.touch()
 
 		# Release should reset the clone
 		await pool.release(workspace)
@@ -101,16 +102,11 @@ class TestWorkspacePool:
 		await pool.cleanup()
 
 	async def test_reset_clone_uses_green_branch_when_available(
-		self, source_repo: Path, pool_dir: Path,
+		self, tmp_path: Path, pool_dir: Path,
 	) -> None:
 		"""Release resets to green branch when configured and ref exists."""
-		import subprocess
-
-		env = {
-			"GIT_AUTHOR_NAME": "test", "GIT_AUTHOR_EMAIL": "test@test.com",
-			"GIT_COMMITTER_NAME": "test", "GIT_COMMITTER_EMAIL": "test@test.com",
-			"PATH": subprocess.check_output(["bash", "-c", "echo $PATH"]).decode().strip(),
-		}
+		# Adds a branch to the source, so it gets its own repo rather than the shared one
+		source_repo = _init_repo(tmp_path / "source")
 
 		# Create autodev/green branch with an extra file in source
 		subprocess.run(
@@ -122,7 +118,7 @@ class TestWorkspacePool:
 		subprocess.run(["git", "add", "."], cwd=str(source_repo), check=True, capture_output=True)
 		subprocess.run(
 			["git", "commit", "-m", "green commit"],
-			cwd=str(source_repo), check=True, capture_output=True, env=env,
+			cwd=str(source_repo), check=True, capture_output=True, env=_GIT_ENV,
 		)
 		subprocess.run(["git", "checkout", "main"], cwd=str(source_repo), check=True, capture_output=True)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 from unittest.mock import patch
@@ -18,7 +19,7 @@ def _git_env() -> dict[str, str]:
 		"GIT_AUTHOR_EMAIL": "test@test.com",
 		"GIT_COMMITTER_NAME": "test",
 		"GIT_COMMITTER_EMAIL": "test@test.com",
-		"PATH": subprocess.check_output(["bash", "-c", "echo $PATH"]).decode().strip(),
+		"PATH": os.environ["PATH"],
 	}
 
 
@@ -28,8 +29,7 @@ def source_repo(tmp_path: Path) -> Path:
 	repo = tmp_path / "source"
 	repo.mkdir()
 	env = _git_env()
-	subprocess.run(["git", "init", str(repo)], check=True, capture_output=True)
-	subprocess.run(["git", "checkout", "-b", "main"], cwd=str(repo), check=True, capture_output=True)
+	subprocess.run(["git", "init", "--initial-branch=main", str(repo)], check=True, capture_output=True)
 	readme = repo / "README.md"
 	readme.write_text("# Test repo\n")
 	subprocess.run(["git", "add", "."], cwd=str(repo), check=True, capture_output=True)